@@ -13,13 +13,22 @@
 # - Keep Value column narrow; prevent first column from stretching too wide
 
 import os
+import sys
 import json
+import atexit
+import shutil
+import tempfile
 import datetime
-import random
+import itertools
 import logging
+import threading
 import importlib
 import csv
 import time
+import functools
+import hashlib
+import pickle
+import re
 
 import qt, ctk, slicer
 from slicer.ScriptedLoadableModule import (
@@ -84,6 +93,15 @@ UI_TEXT = {
 # Logger Helper
 # -------------------------------
 class Logger:
+    __slots__ = ("logger",)
+
+    # processEvents pumps the whole Qt event loop; cap it to once per 100 ms
+    # so log-heavy batch runs don't spend their time repainting.
+    _last_process = 0.0
+    # Bound slicer.app.processEvents, resolved once on first use so the hot
+    # path skips the slicer.app attribute walk and its try/except.
+    _process_events = None
+
     def __init__(self, name="PySERA"):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
@@ -94,24 +112,40 @@ class Logger:
             self.logger.addHandler(console)
 
     def info(self, msg):
-        self._emit(self.logger.info, msg)
+        self._emit(logging.INFO, self.logger.info, msg)
 
     def debug(self, msg):
-        self._emit(self.logger.debug, msg)
+        # Debug lines don't need a UI refresh; skip the event pump.
+        self._emit(logging.DEBUG, self.logger.debug, msg, pump=False)
 
     def warning(self, msg):
-        self._emit(self.logger.warning, msg)
+        self._emit(logging.WARNING, self.logger.warning, msg)
 
     def error(self, msg):
-        self._emit(self.logger.error, msg)
+        self._emit(logging.ERROR, self.logger.error, msg)
 
-    @staticmethod
-    def _emit(fn, msg):
+    def _emit(self, level, fn, msg, pump=True):
+        if not self.logger.isEnabledFor(level):
+            return
         fn(msg)
-        try:
-            slicer.app.processEvents()
-        except Exception:
-            pass
+        if not pump:
+            return
+        # Pumping the event loop from a worker thread is unsafe in Qt;
+        # background log calls just log and let the GUI thread repaint on
+        # its own schedule.
+        if threading.current_thread() is not threading.main_thread():
+            return
+        now = time.monotonic()
+        if now - Logger._last_process > 0.1:
+            Logger._last_process = now
+            pe = Logger._process_events
+            if pe is None:
+                try:
+                    pe = slicer.app.processEvents
+                except Exception:
+                    return
+                Logger._process_events = pe
+            pe()
 
 
 logger = Logger()
@@ -124,43 +158,148 @@ YAML_PATH = os.path.join(MODULE_DIR, "parameters.yaml")
 JSON_PATH = os.path.join(MODULE_DIR, "parameters.json")
 
 
+def _json_loads(s):
+    # orjson parses str/bytes in C, 2-4x faster than the stdlib scanner;
+    # fall back to json when it is not installed (same payload semantics).
+    try:
+        import orjson
+        return orjson.loads(s)
+    except ImportError:
+        return json.loads(s)
+
+
+def _read_yaml_cache(cache_path: str, content_hash: str):
+    """Return the cached config dict if the sidecar matches the hash, else None."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if isinstance(cached, dict) and cached.get("hash") == content_hash:
+            data = cached.get("data")
+            if isinstance(data, dict):
+                return data
+    except Exception:
+        pass
+    return None
+
+
+def _write_yaml_cache(cache_path: str, content_hash: str, data: dict):
+    """Atomically write the parsed config next to the YAML (best effort)."""
+    try:
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"hash": content_hash, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        pass
+
+
 def _load_yaml_if_possible(path: str) -> dict:
     """
     Import-safe YAML loader:
     - Do NOT install PyYAML here.
     - If PyYAML isn't available, return {} so we can fall back to JSON.
+    - Keeps a pickled sidecar cache (parameters.yaml.cache) so repeated
+      Slicer launches skip YAML parsing while the file is unchanged.
     """
+    cache_path = path + ".cache"
+    # PYSERA_CACHE=0 disables the sidecar for devs iterating on the YAML.
+    use_cache = os.environ.get("PYSERA_CACHE", "1") != "0"
+
+    try:
+        # Fast path: untouched YAML means the sidecar (written after the last
+        # parse) is at least as new; skip reading/hashing the YAML entirely.
+        if use_cache and os.path.exists(cache_path) and os.path.getmtime(path) <= os.path.getmtime(cache_path):
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if isinstance(cached, dict) and isinstance(cached.get("data"), dict):
+                return cached["data"]
+    except Exception:
+        pass
+
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except Exception:
+        return {}
+
+    content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if use_cache:
+        cached = _read_yaml_cache(cache_path, content_hash)
+        if cached is not None:
+            return cached
+
     try:
         yaml = importlib.import_module("yaml")
     except Exception:
         return {}
 
+    # LibYAML's C loader is 5-10x faster than the pure-Python SafeLoader and
+    # ships with PyYAML wheels on all Slicer-supported platforms. Feeding it
+    # the raw bytes keeps the UTF-8 decode inside the loader (in C under
+    # libyaml) instead of a separate Python-level decode.
+    loader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        cfg = yaml.load(raw, Loader=loader) or {}
     except Exception:
         return {}
 
+    if cfg and use_cache:
+        _write_yaml_cache(cache_path, content_hash, cfg)
+    return cfg
+
 
+@functools.lru_cache(maxsize=1)
 def load_parameters() -> dict:
     """
     Load config from YAML (if readable) else JSON else {}.
     Called at module import time, so it must be safe.
     """
-    logger.debug(f"MODULE_DIR: {MODULE_DIR}")
-    logger.debug(f"YAML_PATH: {YAML_PATH} (exists={os.path.exists(YAML_PATH)})")
-    logger.debug(f"JSON_PATH: {JSON_PATH} (exists={os.path.exists(JSON_PATH)})")
-
     try:
-        if os.path.exists(YAML_PATH):
+        # One scandir pass yields presence and mtime for both candidate
+        # files in a single directory read, instead of separate
+        # exists/getmtime stats per path.
+        mtimes = {}
+        try:
+            with os.scandir(MODULE_DIR) as it:
+                for entry in it:
+                    if entry.name in ("parameters.yaml", "parameters.json"):
+                        mtimes[entry.name] = entry.stat().st_mtime
+        except OSError:
+            pass
+        yaml_mtime = mtimes.get("parameters.yaml")
+        json_mtime = mtimes.get("parameters.json")
+
+        logger.debug(f"MODULE_DIR: {MODULE_DIR}")
+        logger.debug(f"YAML_PATH: {YAML_PATH} (exists={yaml_mtime is not None})")
+        logger.debug(f"JSON_PATH: {JSON_PATH} (exists={json_mtime is not None})")
+
+        # Shipped extensions carry a pre-converted parameters.json (see
+        # tools/yaml_to_json.py); prefer it over YAML when it is at least as
+        # fresh, so cold start never touches PyYAML. The legacy flat-schema
+        # parameters.json lacks the radiomics section — fall through to YAML
+        # for it rather than returning a config with no defaults.
+        if json_mtime is not None and (yaml_mtime is None or json_mtime >= yaml_mtime):
+            # Own try: a corrupt parameters.json must fall through to the
+            # YAML path, not abort the whole load.
+            try:
+                with open(JSON_PATH, "rb") as f:
+                    cfg = _json_loads(f.read()) or {}
+                if isinstance(cfg, dict) and "radiomics" in cfg:
+                    logger.info(f"Parameters loaded from {JSON_PATH}")
+                    return cfg
+            except Exception as e:
+                logger.warning(f"Unreadable {JSON_PATH} ({e}); falling back to YAML.")
+
+        if yaml_mtime is not None:
             cfg = _load_yaml_if_possible(YAML_PATH)
             if cfg:
                 logger.info(f"Parameters loaded from {YAML_PATH}")
                 return cfg
 
-        if os.path.exists(JSON_PATH):
-            with open(JSON_PATH, "r", encoding="utf-8") as f:
-                cfg = json.load(f) or {}
+        if json_mtime is not None:
+            with open(JSON_PATH, "rb") as f:
+                cfg = _json_loads(f.read()) or {}
             logger.info(f"Parameters loaded from {JSON_PATH}")
             return cfg
 
@@ -171,9 +310,112 @@ def load_parameters() -> dict:
         return {}
 
 
-CFG_FILE = load_parameters()
-RDEF = CFG_FILE.get("radiomics") or {}
-CLI_MAP = CFG_FILE.get("cli_key_map") or {}
+def invalidate_parameters():
+    """Drop the memoized config so the next load_parameters() call re-reads
+    disk. Dev hook for editing parameters.yaml inside a live Slicer session
+    (the sidecar cache still revalidates against the file's mtime/hash)."""
+    load_parameters.cache_clear()
+    for cached in (_cfg_file, _rdef, _cli_map, _rdef_prefixed, _cli_plan):
+        cached.cache_clear()
+
+
+# Config views are computed lazily on first use so importing PySera.py does
+# no disk IO or parsing at all — Slicer startup only pays for the config once
+# the panel is actually opened or a run starts.
+@functools.lru_cache(maxsize=1)
+def _cfg_file() -> dict:
+    return load_parameters()
+
+
+@functools.lru_cache(maxsize=1)
+def _rdef() -> dict:
+    return _cfg_file().get("radiomics") or {}
+
+
+@functools.lru_cache(maxsize=1)
+def _cli_map() -> dict:
+    return _cfg_file().get("cli_key_map") or {}
+
+
+@functools.lru_cache(maxsize=1)
+def _rdef_prefixed() -> dict:
+    """Prefixed defaults computed once so _compose_cfg is a plain dict copy
+    per run instead of re-iterating the config every time."""
+    cfg = _cfg_file()
+    out = {"radiomics_" + k: v for k, v in _rdef().items()}
+    out.update(
+        {k: v for k, v in cfg.items() if isinstance(k, str) and k.startswith("radiomics_")}
+    )
+    return out
+
+
+# CLI keys forwarded verbatim as strings; everything else goes through
+# _normalize. Classified once so _build_cli_kwargs is a flat loop.
+_CLI_PASSTHRU = {"categories", "dimensions", "extraction_mode", "deep_learning_model", "report"}
+
+
+@functools.lru_cache(maxsize=1)
+def _cli_plan():
+    return tuple((src, dst, dst in _CLI_PASSTHRU) for src, dst in _cli_map().items())
+
+# Whitespace control characters flattened to spaces in table cells;
+# translate() does it in one C pass per string.
+_NL_TRANS = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# Metadata columns dropped from the Feature|Value table. PySERA feature
+# names carry no stray whitespace, so a plain lowercase compare suffices.
+_DROP_META = frozenset({"patientid", "roi", "case", "subject", "image", "mask"})
+
+# Numeric literal, accepting bare-dot forms like '.5'/'5.' as float() does.
+_NUM_RE = re.compile(r"^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$")
+
+# Report-verbosity names to logging levels, shared by every run.
+_LEVEL_MAP = {
+    "none": logging.CRITICAL + 1,
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "all": logging.DEBUG,
+}
+
+# IBSI flag checkboxes in the Handcrafted Settings panel: (label, config key,
+# default, tooltip), laid out in build order.
+_IBSI_FLAGS = (
+    ("GL Round", "isGLround", 0, "Enable intensity rounding."),
+    ("Scale", "isScale", 0, "Enable voxel scaling/resampling."),
+    ("Re-segmentation Range", "isReSegRng", 0, "Enable re-segmentation by intensity range."),
+    ("Outlier Removal", "isOutliers", 0, "Enable outlier handling."),
+    ("Quantized Statistics", "isQuntzStat", 1, "Use quantized intensity statistics."),
+    ("2D Isotropic", "isIsot2D", 0, "Use isotropic spacing for 2D mode."),
+)
+
+def _classify_token(s: str):
+    """Classify one trimmed scalar with a single anchored regex match plus a
+    token check — no try/except and no per-branch isdigit/float probing."""
+    if _NUM_RE.match(s) is not None:
+        # Integer only when neither dot nor exponent appears; ".5"/"5." and
+        # exponent forms parse as floats like the plain float() path did.
+        if "." not in s and "e" not in s and "E" not in s:
+            return int(s)
+        return float(s)
+    lo = s.lower()
+    if lo == "none":
+        return None
+    if lo == "auto":
+        return "auto"
+    return s
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_str(s: str):
+    """String branch of PySERALogic._normalize, memoized (CLI maps reuse the
+    same strings run after run). Comma lists come back as tuples."""
+    s = s.strip()
+    if s == "":
+        return ""
+    if "," in s:
+        return tuple(_classify_token(p.strip()) for p in s.split(","))
+    return _classify_token(s)
 
 # -------------------------------
 # Slicer module metadata
@@ -194,12 +436,71 @@ class PySera(ScriptedLoadableModule):
 # -------------------------------
 class PySERALogic(ScriptedLoadableModuleLogic):
 
+    # Resolved pysera module, shared across instances; warmed on first use.
+    _pysera_mod = None
+
+    # Log level last applied to the logger/handlers (see
+    # _configure_logging_level); None until the first configure.
+    _applied_log_level = None
+
+    # Output-CSV naming: one strftime per session, then a counter suffix
+    # (see _make_output_csv).
+    _run_name_base = None
+    _run_counter = itertools.count(1)
+
+    # Output directories already created this session (see _make_output_csv).
+    _ensured_dirs = set()
+
+    # Shared worker pool, kept alive across batch runs so spawn cost (which
+    # dominates small batches, especially on Windows) is paid once.
+    _pool = None
+    _pool_cfg_key = None
+    _pool_atexit_registered = False
+
+    @classmethod
+    def _get_pool(cls, workers: int, cli_kwargs: dict = None):
+        import concurrent.futures
+
+        # The CLI kwargs travel once via the initializer, so the pool must be
+        # rebuilt when they (or the worker count) change between runs.
+        cli_kwargs = dict(cli_kwargs or {})
+        cfg_key = (workers, tuple(sorted((k, repr(v)) for k, v in cli_kwargs.items())))
+        if cls._pool is not None and cls._pool_cfg_key != cfg_key:
+            cls._pool.shutdown(wait=False)
+            cls._pool = None
+        if cls._pool is None:
+            if MODULE_DIR not in sys.path:
+                sys.path.insert(0, MODULE_DIR)
+            from pysera_batch_worker import worker_init
+
+            cls._pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=worker_init, initargs=(cli_kwargs,)
+            )
+            cls._pool_cfg_key = cfg_key
+            if not cls._pool_atexit_registered:
+                cls._pool_atexit_registered = True
+                atexit.register(cls._shutdown_pool)
+        return cls._pool
+
+    @classmethod
+    def _shutdown_pool(cls):
+        if cls._pool is not None:
+            cls._pool.shutdown(wait=False)
+            cls._pool = None
+
     # ---------- pip install/import helpers ----------
-    @staticmethod
-    def _ensure_package_available(package_name: str, import_name: str = None):
+    # Packages already verified importable this session; repeat calls skip
+    # the import probe entirely.
+    _verified_pkgs = set()
+
+    @classmethod
+    def _ensure_package_available(cls, package_name: str, import_name: str = None):
         import_name = import_name or package_name
+        if import_name in cls._verified_pkgs:
+            return
         try:
             importlib.import_module(import_name)
+            cls._verified_pkgs.add(import_name)
             return
         except Exception:
             pass
@@ -209,13 +510,16 @@ class PySERALogic(ScriptedLoadableModuleLogic):
             slicer.util.pip_install(package_name)
             importlib.import_module(import_name)
             logger.info(f"'{package_name}' installed and importable.")
+            cls._verified_pkgs.add(import_name)
         except Exception as e:
             raise ImportError(f"Python package '{package_name}' is required but could not be installed.") from e
 
-    @staticmethod
-    def _import_pysera():
-        PySERALogic._ensure_package_available("pysera", "pysera")
-        return importlib.import_module("pysera")
+    @classmethod
+    def _import_pysera(cls):
+        if cls._pysera_mod is None:
+            cls._ensure_package_available("pysera", "pysera")
+            cls._pysera_mod = importlib.import_module("pysera")
+        return cls._pysera_mod
 
     @staticmethod
     def _normalize(v):
@@ -225,55 +529,22 @@ class PySERALogic(ScriptedLoadableModuleLogic):
             return int(v)
         if isinstance(v, (int, float)):
             return v
-        s = str(v).strip()
-        if s == "":
-            return ""
-        lo = s.lower()
-        if lo == "none":
-            return None
-        if lo == "auto":
-            return "auto"
-        if "," in s:
-            out = []
-            for part in s.split(","):
-                part = part.strip()
-                if part.lower() == "none":
-                    out.append(None)
-                    continue
-                try:
-                    out.append(int(part) if part.isdigit() else float(part))
-                except Exception:
-                    out.append(part)
-            return out
-        try:
-            if "." in s or "e" in lo:
-                return float(s)
-            return int(s)
-        except Exception:
-            return s
+        out = _normalize_str(str(v))
+        # Comma lists are cached as tuples so the cache stays immutable.
+        return list(out) if isinstance(out, tuple) else out
 
     def _compose_cfg(self, params_from_ui: dict) -> dict:
-        cfg = {}
-        for k, v in (RDEF or {}).items():
-            cfg["radiomics_" + k] = v
-        for k, v in (CFG_FILE or {}).items():
-            if isinstance(k, str) and k.startswith("radiomics_"):
-                cfg[k] = v
-        cfg.update(params_from_ui or {})
-        return cfg
+        return {**_rdef_prefixed(), **(params_from_ui or {})}
 
     def _build_cli_kwargs(self, cfg: dict) -> dict:
         cli = {}
-        passthru_str = {"categories", "dimensions", "extraction_mode", "deep_learning_model", "report"}
 
-        for src_key, dst_key in (CLI_MAP or {}).items():
-            if src_key not in cfg:
-                continue
-            raw = cfg[src_key]
+        for src_key, dst_key, is_passthru in _cli_plan():
+            raw = cfg.get(src_key)
             if raw is None or raw == "":
                 continue
 
-            if dst_key in passthru_str:
+            if is_passthru:
                 cli[dst_key] = str(raw)
             else:
                 val = self._normalize(raw)
@@ -294,15 +565,13 @@ class PySERALogic(ScriptedLoadableModuleLogic):
 
     @staticmethod
     def _configure_logging_level(cfg: dict):
-        level_map = {
-            "none": logging.CRITICAL + 1,
-            "error": logging.ERROR,
-            "warning": logging.WARNING,
-            "info": logging.INFO,
-            "all": logging.DEBUG,
-        }
         report_sel = str(cfg.get("radiomics_report", "all")).strip().lower()
-        level = level_map.get(report_sel, logging.DEBUG)
+        level = _LEVEL_MAP.get(report_sel, logging.DEBUG)
+        # Touch logger/handler state only when the level actually changes;
+        # batch runs re-apply the same level for every pair otherwise.
+        if level == PySERALogic._applied_log_level:
+            return
+        PySERALogic._applied_log_level = level
         logger.logger.setLevel(level)
         for h in logger.logger.handlers:
             h.setLevel(level)
@@ -312,16 +581,108 @@ class PySERALogic(ScriptedLoadableModuleLogic):
             os.path.expanduser("~"), "Desktop", "output_result"
         )
         out_dir = os.path.abspath(out_dir)
-        os.makedirs(out_dir, exist_ok=True)
-
-        timestamp = datetime.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-        random_suffix = random.randint(1000, 9999)
-        output_csv = os.path.join(out_dir, f"{prefix}_{timestamp}_{random_suffix}.csv")
+        # One makedirs stat per unique directory per session, not per pair.
+        if out_dir not in PySERALogic._ensured_dirs:
+            os.makedirs(out_dir, exist_ok=True)
+            PySERALogic._ensured_dirs.add(out_dir)
+
+        # Session timestamp plus a monotonic counter: no strftime/PRNG work
+        # per pair and no collisions when pairs finish in the same second.
+        base = PySERALogic._run_name_base
+        if base is None:
+            base = datetime.datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+            PySERALogic._run_name_base = base
+        output_csv = os.path.join(out_dir, f"{prefix}_{base}_{next(PySERALogic._run_counter):04d}.csv")
 
         logger.debug(f"Output directory: {out_dir}")
         logger.info(f"Output CSV path: {output_csv}")
         return output_csv
 
+    @staticmethod
+    def _effective_workers(cfg: dict) -> int:
+        if not cfg.get("radiomics_enable_parallelism", True):
+            return 1
+        raw = cfg.get("radiomics_num_workers", "auto")
+        if isinstance(raw, str):
+            lo = raw.strip().lower()
+            if lo in ("", "auto", "none"):
+                return os.cpu_count() or 1
+            raw = lo
+        try:
+            return max(1, int(float(raw)))
+        except Exception:
+            return os.cpu_count() or 1
+
+    @staticmethod
+    def _link_or_copy(src: str, dst: str):
+        try:
+            os.symlink(src, dst)
+        except Exception:
+            shutil.copy2(src, dst)
+
+    @staticmethod
+    def _merge_shard_csvs(shard_csvs, output_csv):
+        # Byte-faithful streaming append. All shards come from the same
+        # process_batch config, so they share one header; copying the rows
+        # verbatim keeps values exactly as pysera wrote them (a pandas
+        # read/rewrite would re-infer dtypes and e.g. strip leading zeros
+        # from ID-like columns or turn NA-looking strings into NaN).
+        with open(output_csv, "w", encoding="utf-8", newline="") as out:
+            wrote_header = False
+            for p in shard_csvs:
+                if not os.path.exists(p):
+                    continue
+                with open(p, "r", encoding="utf-8", newline="") as f:
+                    header = f.readline()
+                    if not wrote_header and header:
+                        out.write(header)
+                        wrote_header = True
+                    shutil.copyfileobj(f, out)
+
+    def _run_process_batch_parallel(self, image_folder, mask_folder, cfg, cli_kwargs, workers):
+        """
+        Shard the batch folders across a process pool.
+        Returns a summary dict, or None when the inputs don't pair cleanly
+        (caller then falls back to a single pysera.process_batch call).
+        """
+        images = sorted(f for f in os.listdir(image_folder) if not f.startswith("."))
+        masks = set(os.listdir(mask_folder))
+        if len(images) < 2 or any(f not in masks for f in images):
+            return None
+
+        workers = min(workers, len(images))
+        if workers <= 1:
+            return None
+        shards = [images[i::workers] for i in range(workers)]
+
+        staging_root = tempfile.mkdtemp(prefix="pysera_shards_")
+        try:
+            shard_jobs = []
+            for idx, shard in enumerate(shards):
+                img_dir = os.path.join(staging_root, f"shard_{idx}", "images")
+                msk_dir = os.path.join(staging_root, f"shard_{idx}", "masks")
+                os.makedirs(img_dir)
+                os.makedirs(msk_dir)
+                for name in shard:
+                    self._link_or_copy(os.path.join(image_folder, name), os.path.join(img_dir, name))
+                    self._link_or_copy(os.path.join(mask_folder, name), os.path.join(msk_dir, name))
+                shard_jobs.append((img_dir, msk_dir, os.path.join(staging_root, f"shard_{idx}.csv")))
+
+            if MODULE_DIR not in sys.path:
+                sys.path.insert(0, MODULE_DIR)
+            from pysera_batch_worker import run_shard
+
+            logger.info(f"Dispatching {len(images)} cases across {workers} worker processes ...")
+            pool = self._get_pool(workers, cli_kwargs)
+            futures = [pool.submit(run_shard, *job) for job in shard_jobs]
+            for fut in futures:
+                fut.result()
+
+            self._merge_shard_csvs([job[2] for job in shard_jobs], cfg["_output_csv_path"])
+            return {"processed_files": len(images), "worker_processes": workers}
+        finally:
+            shutil.rmtree(staging_root, ignore_errors=True)
+
     def _run_process_batch(self, image_input, mask_input, cfg: dict):
         pysera = self._import_pysera()
         cli_kwargs = self._build_cli_kwargs(cfg)
@@ -329,6 +690,16 @@ class PySERALogic(ScriptedLoadableModuleLogic):
         cli_kwargs.setdefault("dimensions", str(cfg.get("radiomics_dimensions", "all")))
         self._configure_logging_level(cfg)
 
+        if os.path.isdir(str(image_input)) and os.path.isdir(str(mask_input)):
+            workers = self._effective_workers(cfg)
+            if workers > 1:
+                try:
+                    result = self._run_process_batch_parallel(image_input, mask_input, cfg, cli_kwargs, workers)
+                    if result is not None:
+                        return result
+                except Exception as e:
+                    logger.warning(f"Parallel batch failed ({e}); falling back to a single process.")
+
         return pysera.process_batch(
             image_input=image_input,
             mask_input=mask_input,
@@ -360,62 +731,47 @@ class PySERALogic(ScriptedLoadableModuleLogic):
             return []
 
         def _filter_meta(pairs):
-            drop = {"patientid", "roi", "case", "subject", "image", "mask"}
-            out = []
-            for k, v in pairs:
-                if str(k).strip().lower() in drop:
-                    continue
-                out.append([k, v])
-            return out
-
-        # DataFrame-like (duck-typing)
+            return [
+                [k, v]
+                for k, v in pairs
+                if (k if isinstance(k, str) else str(k)).lower() not in _DROP_META
+            ]
+
+        # DataFrame-like (duck-typing): take the first row directly instead of
+        # round-tripping the whole frame through to_dict.
         try:
-            has_columns = hasattr(fx, "columns")
-            has_to_dict = hasattr(fx, "to_dict") and callable(getattr(fx, "to_dict"))
-            if has_columns and has_to_dict:
-                row_dict = None
-                try:
-                    recs = fx.to_dict(orient="records")
-                    if recs and isinstance(recs[0], dict):
-                        row_dict = recs[0]
-                except Exception:
-                    row_dict = None
-
-                if row_dict is None and hasattr(fx, "iloc"):
-                    try:
-                        row_dict = fx.iloc[0].to_dict()
-                    except Exception:
-                        row_dict = None
-
-                if row_dict is None:
-                    try:
-                        col_map = fx.to_dict()
-                        row_dict = {}
-                        for k, v in col_map.items():
-                            if isinstance(v, dict) and v:
-                                row_dict[k] = next(iter(v.values()))
-                            else:
-                                row_dict[k] = v
-                    except Exception:
-                        row_dict = None
-
-                if isinstance(row_dict, dict) and row_dict:
-                    try:
-                        cols = list(fx.columns)
-                    except Exception:
-                        cols = list(row_dict.keys())
-                    pairs = [(str(c), row_dict.get(c)) for c in cols]
+            if hasattr(fx, "columns") and hasattr(fx, "iloc"):
+                if len(fx) == 0:
+                    return []
+                cols = fx.columns.tolist()
+                values = fx.iloc[0].values.tolist()
+                pairs = list(zip(map(str, cols), values))
+                if pairs:
                     return _filter_meta(pairs)
         except Exception:
             pass
 
         if isinstance(fx, dict):
-            keys = list(fx.keys())
+            # dict-of-arrays: let pandas/NumPy do the flatten/transpose in C
+            # instead of a per-feature Python loop.
+            if fx and all(isinstance(v, (list, tuple)) for v in fx.values()):
+                try:
+                    pd = importlib.import_module("pandas")
+                    df = pd.DataFrame(fx)
+                    pairs = list(zip(
+                        df.columns.astype(str).repeat(len(df)).tolist(),
+                        df.values.ravel("F").tolist(),
+                    ))
+                    return _filter_meta(pairs)
+                except Exception:
+                    pass
+            # Sort items directly so emitting the rows needs no second
+            # per-key hash lookup.
             try:
-                keys.sort()
-            except Exception:
-                pass
-            return _filter_meta([(str(k), fx[k]) for k in keys])
+                items = sorted(fx.items(), key=lambda kv: kv[0])
+            except TypeError:
+                items = list(fx.items())
+            return _filter_meta([(str(k), v) for k, v in items])
 
         if isinstance(fx, list):
             # 2×N -> transpose
@@ -445,14 +801,13 @@ class PySERALogic(ScriptedLoadableModuleLogic):
         if isinstance(fx, str):
             s = fx.strip()
             try:
-                obj = json.loads(s)
+                obj = _json_loads(s)
                 if isinstance(obj, dict):
-                    keys = list(obj.keys())
                     try:
-                        keys.sort()
-                    except Exception:
-                        pass
-                    return _filter_meta([(str(k), obj[k]) for k in keys])
+                        items = sorted(obj.items(), key=lambda kv: kv[0])
+                    except TypeError:
+                        items = list(obj.items())
+                    return _filter_meta([(str(k), v) for k, v in items])
             except Exception:
                 pass
             return [["features_extracted", fx]]
@@ -461,54 +816,138 @@ class PySERALogic(ScriptedLoadableModuleLogic):
 
     # ---------- CSV fallback ----------
     @staticmethod
-    def _wait_for_readable_file(path: str, retries: int = 160, delay: float = 0.25):
-        last_err = None
-        for _ in range(retries):
-            try:
-                if os.path.exists(path) and os.path.getsize(path) > 0:
-                    with open(path, "r", encoding="utf-8", newline=""):
-                        return True
-            except Exception as e:
-                last_err = e
-            time.sleep(delay)
-        if last_err:
-            raise last_err
+    def _wait_for_readable_file(path: str):
+        # Single non-blocking readability check; the widget's filesystem
+        # watcher re-fires us when the file shows up or grows, so there is
+        # no reason to sleep on the UI thread here.
+        try:
+            if os.path.exists(path) and os.path.getsize(path) > 0:
+                with open(path, "r", encoding="utf-8", newline=""):
+                    return True
+        except Exception:
+            pass
         return False
 
+    @staticmethod
+    def _feature_value_rows_pandas(pd, output_csv: str):
+        # C-engine parse in one pass; dtype=str keeps values verbatim like
+        # csv.reader would, and na_filter=False skips NaN scanning entirely.
+        df = pd.read_csv(output_csv, engine="c", dtype=str, na_filter=False)
+        header = [str(c) for c in df.columns]
+        if not header:
+            return []
+        header_l = [h.strip().lower() for h in header]
+
+        # long format: Feature,Value
+        if len(header) >= 2 and header_l[0] in ("feature", "name") and header_l[1] in ("value", "val"):
+            return df.iloc[:, :2].values.tolist()
+
+        # wide format: headers are features, first data row contains values
+        if len(df) >= 1 and len(header) >= 2:
+            values = df.iloc[0].tolist()
+            return [[header[i], values[i]] for i in range(len(header))]
+
+        return [[",".join(str(v) for v in row), ""] for row in df.values.tolist()]
+
     def load_features_as_feature_value_rows(self, output_csv: str):
         ok = self._wait_for_readable_file(output_csv)
         if not ok:
             return []
 
+        # Prefer pandas (pysera already pulls it in); its C parser is much
+        # faster than csv.reader on wide radiomics CSVs.
+        try:
+            pd = importlib.import_module("pandas")
+        except Exception:
+            pd = None
+        if pd is not None:
+            try:
+                return self._feature_value_rows_pandas(pd, output_csv)
+            except Exception:
+                pass
+
+        # Stream: peek at the first two rows to decide the format instead of
+        # materializing the whole file.
         with open(output_csv, "r", encoding="utf-8", newline="") as f:
             reader = csv.reader(f)
-            rows = list(reader)
-
-        if not rows:
-            return []
-
-        header = rows[0]
-        header_l = [h.strip().lower() for h in header]
+            header = next(reader, None)
+            if header is None:
+                return []
+            second = next(reader, None)
+            header_l = [h.strip().lower() for h in header]
+
+            # long format: Feature,Value
+            if len(header) >= 2 and header_l[0] in ("feature", "name") and header_l[1] in ("value", "val"):
+                out = []
+                if second is not None and len(second) >= 2:
+                    out.append([second[0], second[1]])
+                out.extend([r[0], r[1]] for r in reader if len(r) >= 2)
+                return out
+
+            # wide format: headers are features, 2nd row contains values
+            if second is not None and len(second) == len(header) and len(header) >= 2:
+                return [[header[i], second[i]] for i in range(len(header))]
 
-        # long format: Feature,Value
-        if len(header) >= 2 and header_l[0] in ("feature", "name") and header_l[1] in ("value", "val"):
             out = []
-            for r in rows[1:]:
-                if len(r) >= 2:
-                    out.append([r[0], r[1]])
+            if second:
+                out.append([",".join(second), ""])
+            out.extend([",".join(r), ""] for r in reader if r)
             return out
 
-        # wide format: headers are features, 2nd row contains values
-        if len(rows) >= 2 and len(rows[1]) == len(header) and len(header) >= 2:
-            values = rows[1]
-            return [[header[i], values[i]] for i in range(len(header))]
+# -------------------------------
+# Results table model
+# -------------------------------
+class _PairsTableModel(qt.QAbstractTableModel):
+    """
+    Two-column (name, value) model backing the results tables.
+    One list of pairs instead of a QTableWidgetItem per cell; a model reset
+    is a single view update. Cells are stringified/shortened once per fill
+    so scrolling and hover repaints are plain list indexing.
+    """
+
+    def __init__(self, headers, value_max_len=90, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._value_max_len = value_max_len
+        self._rows = []
+
+    def setPairs(self, rows):
+        vmax = self._value_max_len
+        shorten = PySeraWidget._shorten_for_cell
+        prepared = [
+            ("" if r[0] is None else str(r[0]), shorten(r[1], vmax))
+            for r in rows
+        ]
+        # Re-running with unchanged results (Apply re-clicks) is a no-op:
+        # same display strings mean nothing to reset or repaint.
+        if prepared == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = prepared
+        self.endResetModel()
+
+    def rowCount(self, parent=None):
+        return len(self._rows)
+
+    def columnCount(self, parent=None):
+        return 2
+
+    def data(self, index, role=None):
+        if role not in (qt.Qt.DisplayRole, None):
+            return None
+        try:
+            return self._rows[index.row()][index.column()]
+        except Exception:
+            return None
+
+    def flags(self, index):
+        return qt.Qt.ItemIsEnabled | qt.Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=None):
+        if role in (qt.Qt.DisplayRole, None) and orientation == qt.Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
 
-        out = []
-        for r in rows[1:]:
-            if not r:
-                continue
-            out.append([",".join(r), ""])
-        return out
 
 # -------------------------------
 # Widget
@@ -522,13 +961,39 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         self.dimensionChecks = []
         self._categoryByName = {}
         self._dimensionByName = {}
-        self._csvPollRemaining = 0
+        self._widget_readers = {}
+        self._category_texts = []
+        self._dimension_texts = []
+        self._csvWatcher = None
+        self._csvFallbackTimer = None
+        self._runExecutor = None
+        self._runFuture = None
+        self._runPollTimer = None
+        self._runModeStr = ""
         self._ignoreDimSync = False
+        self._dimSyncPending = False
+        self._skipNextDimSync = False
+        self._DIM_TO_CATS = {}
+        self._hcBuilt = False
+        self._hcLayout = None
+        self._resultTablesBuilt = False
+        self._runLay = None
+        self._stateSavePending = False
+        self._savedState = {}
+        self._dirCache = {}
 
     # ---------- helpers ----------
     @staticmethod
     def _wtext(widget) -> str:
         # Some Qt wrappers expose .text as property (string), others as method.
+        # Widgets we created carry a pre-bound accessor (see _bind_fast_text);
+        # the getattr/callable probing only runs for foreign widgets.
+        fast = getattr(widget, "_fast_text", None)
+        if fast is not None:
+            try:
+                return fast()
+            except Exception:
+                return ""
         try:
             t = getattr(widget, "text", "")
             if callable(t):
@@ -540,31 +1005,48 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
             return ""
 
     @staticmethod
-    def _val_from_widget(w):
+    def _bind_fast_text(widget):
+        try:
+            t = widget.text
+            widget._fast_text = t if callable(t) else (lambda w=widget: str(w.text))
+        except Exception:
+            pass
+        return widget
+
+    def _reader_for(self, w):
+        """Bind the right value reader for a widget once, so per-run gathering
+        is a single call instead of an isinstance ladder per widget."""
         if isinstance(w, qt.QCheckBox):
-            return 1 if w.isChecked() else 0
+            return lambda w=w: 1 if w.isChecked() else 0
         if isinstance(w, (qt.QSpinBox, qt.QDoubleSpinBox)):
-            return w.value() if callable(getattr(w, "value", None)) else w.value
+            v = getattr(w, "value", None)
+            return v if callable(v) else (lambda w=w: w.value)
         if isinstance(w, qt.QComboBox):
-            return w.currentText() if callable(getattr(w, "currentText", None)) else str(w.currentText)
+            return lambda w=w: self._combo_text_safe(w)
         if isinstance(w, qt.QLineEdit):
-            return w.text() if callable(getattr(w, "text", None)) else str(getattr(w, "text", ""))
-        return ""
+            t = getattr(w, "text", None)
+            return t if callable(t) else (lambda w=w: str(getattr(w, "text", "")))
+        return lambda: ""
 
     @staticmethod
     def _set_combo_safe(combo: qt.QComboBox, value: str):
         if value is None:
             return
+        # findText does the case-insensitive scan in C; the manual itemText
+        # loop stays as a fallback for PythonQt signature quirks.
+        try:
+            idx = combo.findText(str(value), qt.Qt.MatchFixedString)
+            if idx >= 0:
+                combo.setCurrentIndex(idx)
+            return
+        except Exception:
+            pass
         try:
             count = combo.count
         except Exception:
             count = combo.count()
         for i in range(count):
-            try:
-                it = combo.itemText(i)
-            except Exception:
-                it = combo.itemText(i)
-            if str(it).lower() == str(value).lower():
+            if str(combo.itemText(i)).lower() == str(value).lower():
                 combo.setCurrentIndex(i)
                 return
 
@@ -574,11 +1056,62 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         except Exception:
             return str(getattr(combo, "currentText", ""))
 
+    def _set_status(self, kind: str, text: str):
+        """Update the status label; the colors live in the panel stylesheet,
+        keyed by the pyseraStatus property, so a status change repolishes one
+        label instead of re-setting a stylesheet on it."""
+        self.statusLabel.setText(text)
+        if kind != self._statusKind:
+            self._statusKind = kind
+            self.statusLabel.setProperty("pyseraStatus", kind)
+            style = self.statusLabel.style()
+            style.unpolish(self.statusLabel)
+            style.polish(self.statusLabel)
+
+    # All panel styling handled by one stylesheet on the tab root (see
+    # setup()); widgets are only tagged with properties, so construction does
+    # no per-widget stylesheet parses or style re-resolutions.
+    _COMPACT_WIDTHS = (160, 200)
+
+    # Property-selected rules for the bold group boxes and the status label.
+    _PANEL_QSS = (
+        'QGroupBox[pyseraBoldGroup="true"] { font-weight: bold; font-size: 14px; }\n'
+        'QLabel[pyseraStatus="ready"] { color: green; font-weight: bold; font-size: 12px; }\n'
+        'QLabel[pyseraStatus="done"] { color: green; font-weight: bold; }\n'
+        'QLabel[pyseraStatus="running"] { color: blue; font-weight: bold; }\n'
+        'QLabel[pyseraStatus="error"] { color: red; font-weight: bold; }'
+    )
+
+    @classmethod
+    def _panel_stylesheet(cls) -> str:
+        rules = []
+        for width in cls._COMPACT_WIDTHS:
+            selectors = ", ".join(
+                f'{klass}[pyseraCompactWidth="{width}"]'
+                for klass in ("QLineEdit", "QComboBox", "QSpinBox", "QDoubleSpinBox")
+            )
+            rules.append(f"{selectors} {{ min-width: {width}px; max-width: {width}px; }}")
+        rules.append(cls._PANEL_QSS)
+        return "\n".join(rules)
+
+    @staticmethod
+    def _tune_combo(cb: qt.QComboBox) -> qt.QComboBox:
+        """Size combos from a fixed content length so showing one never
+        walks and measures the whole item list."""
+        try:
+            cb.setSizeAdjustPolicy(qt.QComboBox.AdjustToMinimumContentsLengthWithIcon)
+            cb.setMinimumContentsLength(18)
+        except Exception:
+            pass
+        return cb
+
+    # Editor types the compact-width stylesheet applies to; resolved once.
+    _SHRINKABLE = (qt.QLineEdit, qt.QComboBox, qt.QSpinBox, qt.QDoubleSpinBox)
+
     @staticmethod
     def _shrink_editor(w, fixed_width=160):
-        if isinstance(w, (qt.QLineEdit, qt.QComboBox, qt.QSpinBox, qt.QDoubleSpinBox)):
-            w.setFixedWidth(int(fixed_width))
-            w.setSizePolicy(qt.QSizePolicy.Fixed, qt.QSizePolicy.Preferred)
+        if isinstance(w, PySeraWidget._SHRINKABLE):
+            w.setProperty("pyseraCompactWidth", int(fixed_width))
         return w
 
     def _add_two_grid(self, grid: qt.QGridLayout, row: int, label1: str, widget1, label2: str, widget2):
@@ -606,12 +1139,12 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         checks = []
         cols = 4
         default_all = (str(default_str).strip().lower() == "all")
-        wanted = set()
+        wanted = frozenset()
         if not default_all and isinstance(default_str, str):
-            wanted = {x.strip().lower() for x in default_str.split(",") if x.strip()}
+            wanted = frozenset(x.strip().lower() for x in default_str.split(",") if x.strip())
 
         for idx, name in enumerate(options):
-            cb = qt.QCheckBox(name)
+            cb = self._bind_fast_text(qt.QCheckBox(name))
             cb.setChecked(True if default_all else (name.lower() in wanted))
             r = idx // cols
             c = idx % cols
@@ -621,60 +1154,98 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         v.addLayout(grid)
         return gb, checks
 
+    def _schedule_dim_sync(self, *_):
+        # Coalesce toggled-signal storms (e.g. Select All flipping every box)
+        # into a single sync pass on the next event-loop tick. Toggles made
+        # by the sync pass itself don't schedule another one.
+        if self._dimSyncPending or getattr(self, "_ignoreDimSync", False):
+            return
+        self._dimSyncPending = True
+        qt.QTimer.singleShot(0, self._flush_dim_sync)
+
+    def _flush_dim_sync(self):
+        self._dimSyncPending = False
+        # A state restore supersedes the startup sync: recomputing the
+        # categories from the dimension boxes here would wipe the category
+        # selection that was just read back from state.json.
+        if self._skipNextDimSync:
+            self._skipNextDimSync = False
+            return
+        self._on_dimension_changed(self._DIM_TO_CATS)
+
     def _on_dimension_changed(self, dim_to_cats: dict, *_):
         if getattr(self, "_ignoreDimSync", False):
             return
 
-        checked_dims = []
-
-        for cb in getattr(self, "dimensionChecks", []):
-            if cb.isChecked():
-                checked_dims.append(self._wtext(cb).strip().lower())
-
-        if "all" in checked_dims:
-            for dcb in self.dimensionChecks:
-                if not dcb.isChecked():
-                    dcb.setChecked(True)
-            for ccb in self.categoryChecks:
-                if not ccb.isChecked():
-                    ccb.setChecked(True)
-            return
+        # Lowercased category sets per dimension, computed on first use.
+        dim_to_catset = getattr(self, "_dimToCatset", None)
+        if dim_to_catset is None:
+            dim_to_catset = {d: frozenset(c.lower() for c in cats) for d, cats in dim_to_cats.items()}
+            self._dimToCatset = dim_to_catset
+
+        # Lowercased dimension labels, read from Qt once and reused on every
+        # toggle instead of a _wtext/strip/lower round-trip per checkbox.
+        dim_checks = getattr(self, "dimensionChecks", [])
+        lowers = getattr(self, "_dimLowerTexts", None)
+        if lowers is None or len(lowers) != len(dim_checks):
+            lowers = [self._wtext(cb).strip().lower() for cb in dim_checks]
+            self._dimLowerTexts = lowers
+
+        checked_dims = [t for cb, t in zip(dim_checks, lowers) if cb.isChecked()]
+
+        # Mutations below are guarded so the setChecked cascade does not
+        # schedule another sync pass; only genuinely flipped boxes repaint.
+        self._ignoreDimSync = True
+        try:
+            if "all" in checked_dims:
+                for dcb in dim_checks:
+                    if not dcb.isChecked():
+                        dcb.setChecked(True)
+                for ccb in self.categoryChecks:
+                    if not ccb.isChecked():
+                        ccb.setChecked(True)
+                return
 
-        if not checked_dims:
-            for ccb in self.categoryChecks:
-                if ccb.isChecked():
-                    ccb.setChecked(False)
-            return
+            if not checked_dims:
+                for ccb in self.categoryChecks:
+                    if ccb.isChecked():
+                        ccb.setChecked(False)
+                return
 
-        wanted = set()
-        for d in checked_dims:
-            d_key = "2_5d" if d in ("2_5d", "2.5d") else d
-            cats = dim_to_cats.get(d_key, [])
-            wanted.update(c.lower() for c in cats)
+            wanted = set()
+            for d in checked_dims:
+                d_key = "2_5d" if d in ("2_5d", "2.5d") else d
+                wanted |= dim_to_catset.get(d_key, frozenset())
 
-        for name, ccb in getattr(self, "_categoryByName", {}).items():
-            ccb.setChecked(name in wanted)
+            for name, ccb in getattr(self, "_categoryByName", {}).items():
+                if ccb.isChecked() != (name in wanted):
+                    ccb.setChecked(name in wanted)
+        finally:
+            self._ignoreDimSync = False
 
     @staticmethod
     def _shorten_for_cell(v, max_len=90):
-        s = "" if v is None else str(v)
-        s = s.replace("\n", " ").strip()
+        if v is None:
+            return ""
+        s = v if type(v) is str else str(v)
+        s = s.translate(_NL_TRANS).strip()
         if len(s) <= max_len:
             return s
         return s[: max_len - 1] + "…"
 
-    def _polish_table_after_fill(self, table: qt.QTableWidget):
+    def _polish_table_after_fill(self, table: qt.QTableView):
         """
         Call after filling table to force a stable/clean layout.
         Prevents header jitter and makes sure stretch/fixed works.
         """
         table.setUpdatesEnabled(False)
         try:
-            table.resizeRowsToContents()
-            # keep rows from becoming too tall
-            for r in range(table.rowCount):
-                if table.rowHeight(r) > 26:
-                    table.setRowHeight(r, 26)
+            # Rows are fixed-height (see _apply_two_column_widths), so a
+            # content resize only matters for small tables; skip the O(rows)
+            # pass on large feature sets.
+            model = table.model()
+            if model is not None and model.rowCount() < 50:
+                table.resizeRowsToContents()
         except Exception:
             pass
         table.setUpdatesEnabled(True)
@@ -682,7 +1253,7 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
 
     def _apply_two_column_widths(
             self,
-            table: qt.QTableWidget,
+            table: qt.QTableView,
             value_width: int = 220,
             min_feature_width: int = 180,
     ):
@@ -703,9 +1274,10 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         table.setSelectionMode(qt.QAbstractItemView.SingleSelection)
         table.setEditTriggers(qt.QAbstractItemView.NoEditTriggers)
 
-        # compact rows
+        # compact rows, fixed height so no per-row measuring is needed
         try:
             table.verticalHeader().setDefaultSectionSize(22)
+            table.verticalHeader().setSectionResizeMode(qt.QHeaderView.Fixed)
         except Exception:
             pass
         table.verticalHeader().setVisible(False)
@@ -763,73 +1335,456 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         tabs.addTab(page, title)
         return inner_v
 
-    def _fill_extracted_features_table(self, rows):
-        self.featureTable.clear()
-        self.featureTable.setRowCount(0)
-        self.featureTable.setColumnCount(2)
-        self.featureTable.setHorizontalHeaderLabels(["Feature", "Value"])
+    def _toggle_hc_mode(self, *_):
+        """Enable/disable the handcrafted-only groups to match the mode combo."""
+        pretty = self._combo_text_safe(self._extrModeCombo).strip().lower()
+        is_hand = ("handcrafted" in pretty)
+        for g in self._hc_groups:
+            g.setEnabled(is_hand)
+
+    def _ensure_result_tables_built(self):
+        """Build the summary and features tables on first need."""
+        if self._resultTablesBuilt:
+            return
+        self._resultTablesBuilt = True
+        runLay = self._runLay
+
+        # Summary table
+        runLay.addWidget(qt.QLabel(UI_TEXT["lbl_summary"] + ":"))
+        self.summaryModel = _PairsTableModel(["Parameter", "Value"], value_max_len=80)
+        self.summaryTable = qt.QTableView()
+        self.summaryTable.setModel(self.summaryModel)
+        self.summaryTable.verticalHeader().setVisible(False)
+        self.summaryTable.setEditTriggers(qt.QAbstractItemView.NoEditTriggers)
+        self.summaryTable.setSelectionBehavior(qt.QAbstractItemView.SelectRows)
+        self.summaryTable.setAlternatingRowColors(True)
+        self.summaryTable.setMaximumHeight(140)
+        runLay.addWidget(self.summaryTable)
 
-        for feat, val in rows:
-            r = self.featureTable.rowCount
-            self.featureTable.insertRow(r)
-            self.featureTable.setItem(r, 0, qt.QTableWidgetItem("" if feat is None else str(feat)))
-            self.featureTable.setItem(r, 1, qt.QTableWidgetItem(self._shorten_for_cell(val, 120)))
+        # Extracted Features table
+        runLay.addWidget(qt.QLabel(UI_TEXT["lbl_extracted"] + ":"))
+        self.featureModel = _PairsTableModel(["Feature", "Value"], value_max_len=120)
+        self.featureTable = qt.QTableView()
+        self.featureTable.setModel(self.featureModel)
+        self.featureTable.verticalHeader().setVisible(False)
+        self.featureTable.setEditTriggers(qt.QAbstractItemView.NoEditTriggers)
+        self.featureTable.setSelectionBehavior(qt.QAbstractItemView.SelectRows)
+        self.featureTable.setAlternatingRowColors(True)
+        self.featureTable.setMinimumHeight(220)
+        self.featureTable.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Expanding)
+        runLay.addWidget(self.featureTable, 1)
 
+        # Geometry is fixed once here; fills only swap model data, so no
+        # header/layout pass re-runs per compute.
+        self._apply_two_column_widths(self.summaryTable, value_width=260, min_feature_width=220)
         self._apply_two_column_widths(self.featureTable, value_width=200, min_feature_width=260)
+
+    def _fill_extracted_features_table(self, rows):
+        self._ensure_result_tables_built()
+        self.featureModel.setPairs(rows)
         self._polish_table_after_fill(self.featureTable)
 
     def _fill_summary_table(self, items):
-        self.summaryTable.clear()
-        self.summaryTable.setRowCount(0)
-        self.summaryTable.setColumnCount(2)
-        self.summaryTable.setHorizontalHeaderLabels(["Parameter", "Value"])
+        self._ensure_result_tables_built()
+        self.summaryModel.setPairs(items)
+        self._polish_table_after_fill(self.summaryTable)
+
+    def _stop_csv_watch(self):
+        w = getattr(self, "_csvWatcher", None)
+        self._csvWatcher = None
+        if w is not None:
+            try:
+                w.deleteLater()
+            except Exception:
+                pass
+        t = getattr(self, "_csvFallbackTimer", None)
+        self._csvFallbackTimer = None
+        if t is not None:
+            try:
+                t.stop()
+                t.deleteLater()
+            except Exception:
+                pass
 
-        for i, (k, v) in enumerate(items):
-            self.summaryTable.insertRow(i)
-            self.summaryTable.setItem(i, 0, qt.QTableWidgetItem(str(k)))
-            self.summaryTable.setItem(i, 1, qt.QTableWidgetItem(self._shorten_for_cell(v, 80)))
+    def _poll_csv_until_ready(self, output_csv, timeout_s=40, fallback_interval_ms=1000):
+        """
+        Load the output CSV as soon as pysera finishes writing it.
+        Event-driven via QFileSystemWatcher on the output directory (and the
+        file itself once it appears); a coarse QTimer is only used when the
+        watcher isn't supported on the platform.
+        """
+        self._stop_csv_watch()
+        deadline = time.time() + timeout_s
+        self._csvLastSize = -1
 
-        self._apply_two_column_widths(self.summaryTable, value_width=260, min_feature_width=220)
-        self._polish_table_after_fill(self.summaryTable)
+        def _try_load(*_, final=False):
+            if getattr(self, "_csvWatcher", None) is None and getattr(self, "_csvFallbackTimer", None) is None:
+                return
 
-    def _poll_csv_until_ready(self, output_csv, tries=160, interval_ms=250):
-        self._csvPollRemaining = tries
+            # Only parse once the size has been stable across two reads —
+            # a growing file means pysera is still flushing.
+            try:
+                size = os.path.getsize(output_csv)
+            except Exception:
+                size = -1
+            if size > 0 and size != self._csvLastSize:
+                self._csvLastSize = size
+                qt.QTimer.singleShot(100, lambda: _try_load(final=final))
+                return
 
-        def _tick():
-            self._csvPollRemaining -= 1
             try:
                 rows = self.logic.load_features_as_feature_value_rows(output_csv)
-                if rows:
-                    self._fill_extracted_features_table(rows)
-                    self.statusLabel.setText(f"Done. Loaded features from CSV.")
-                    self.statusLabel.setStyleSheet("color: green; font-weight: bold;")
-                    logger.info(f"Loaded features from CSV: {output_csv}")
-                    print(f"[PySera] Loaded features from CSV: {output_csv}")
-                    return
             except Exception:
-                pass
+                rows = []
 
-            if self._csvPollRemaining > 0:
-                qt.QTimer.singleShot(interval_ms, _tick)
-            else:
+            if rows:
+                self._stop_csv_watch()
+                self._fill_extracted_features_table(rows)
+                self._set_status("done", "Done. Loaded features from CSV.")
+                logger.info(f"Loaded features from CSV: {output_csv}")
+                print(f"[PySera] Loaded features from CSV: {output_csv}")
+                return
+
+            w = getattr(self, "_csvWatcher", None)
+            if w is not None and os.path.exists(output_csv):
+                # Watch the file itself too, so later flushes re-fire us.
+                try:
+                    w.addPath(output_csv)
+                except Exception:
+                    pass
+
+            if final or time.time() >= deadline:
+                self._stop_csv_watch()
                 self._fill_extracted_features_table([["Error", "Could not load features (CSV not ready/locked)"]])
-                self.statusLabel.setText("Error: CSV was not ready in time.")
-                self.statusLabel.setStyleSheet("color: red; font-weight: bold;")
+                self._set_status("error", "Error: CSV was not ready in time.")
                 logger.error(f"CSV not ready in time: {output_csv}")
                 print(f"[PySera] CSV not ready in time: {output_csv}")
 
-        self.statusLabel.setText("Running... waiting for output file to finalize.")
-        self.statusLabel.setStyleSheet("color: blue; font-weight: bold;")
-        qt.QTimer.singleShot(interval_ms, _tick)
-
-    def setup(self):
-        super().setup()
-        root = self.layout
-        root.setSpacing(10)
-
-        tabs = qt.QTabWidget()
-        tabs.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Expanding)
-        root.addWidget(tabs, 1)
+        self._set_status("running", "Running... waiting for output file to finalize.")
+
+        try:
+            watcher = qt.QFileSystemWatcher([os.path.dirname(output_csv) or "."])
+            watcher.directoryChanged.connect(_try_load)
+            watcher.fileChanged.connect(_try_load)
+            self._csvWatcher = watcher
+        except Exception:
+            self._csvWatcher = None
+            timer = qt.QTimer()
+            timer.setInterval(fallback_interval_ms)
+            timer.timeout.connect(_try_load)
+            timer.start()
+            self._csvFallbackTimer = timer
+
+        # Timeout guard, and catches a write that completed before the watch
+        # was installed. Coarse Qt timers can fire a little early, so the
+        # timeout shot forces the deadline branch: without that, a run that
+        # never produces the CSV would get no further filesystem events and
+        # the watcher would wait forever.
+        qt.QTimer.singleShot(0, _try_load)
+        qt.QTimer.singleShot(int(timeout_s * 1000), lambda: _try_load(final=True))
+
+    def _list_dir_cached(self, path):
+        """
+        Basenames under path via one C-backed scandir pass, cached per folder
+        mtime so repeat runs on unchanged folders skip the re-listing.
+        Returns None when path isn't a readable directory.
+        """
+        try:
+            st = os.stat(path)
+        except Exception:
+            return None
+        cached = self._dirCache.get(path)
+        if cached is not None and cached[0] == st.st_mtime:
+            return cached[1]
+        try:
+            with os.scandir(path) as it:
+                names = sorted(e.name for e in it if not e.name.startswith("."))
+        except Exception:
+            return None
+        self._dirCache[path] = (st.st_mtime, names)
+        return names
+
+    # ---------- GUI state persistence ----------
+    @staticmethod
+    def _state_path() -> str:
+        try:
+            base = qt.QStandardPaths.writableLocation(qt.QStandardPaths.AppConfigLocation)
+        except Exception:
+            base = ""
+        if not base:
+            base = os.path.join(os.path.expanduser("~"), ".config", "SlicerPySERA")
+        return os.path.join(base, "pysera", "state.json")
+
+    def _apply_value_to_widget(self, w, v):
+        try:
+            if isinstance(w, qt.QCheckBox):
+                w.setChecked(bool(v))
+            elif isinstance(w, (qt.QSpinBox, qt.QDoubleSpinBox)):
+                w.setValue(v if isinstance(v, (int, float)) else float(v))
+            elif isinstance(w, qt.QComboBox):
+                self._set_combo_safe(w, str(v))
+            elif isinstance(w, qt.QLineEdit):
+                w.setText("" if v is None else str(v))
+        except Exception:
+            pass
+
+    def _connect_state_autosave(self, widgets):
+        for w in widgets:
+            for sig in ("toggled", "valueChanged", "textChanged", "currentIndexChanged"):
+                try:
+                    getattr(w, sig).connect(self._schedule_state_save)
+                    break
+                except Exception:
+                    continue
+
+    def _schedule_state_save(self, *_):
+        if self._stateSavePending:
+            return
+        self._stateSavePending = True
+        qt.QTimer.singleShot(500, self._save_state)
+
+    def _save_state(self):
+        self._stateSavePending = False
+        # Readers for the lazily built Handcrafted panel don't exist until
+        # first expansion; start from the previously saved params so those
+        # persisted values survive saves made before the panel is built.
+        params = dict((self._savedState or {}).get("params") or {})
+        params.update({k: r() for k, r in self._widget_readers.items()})
+        state = {
+            "params": params,
+            "categories": [t for t, cb in zip(self._category_texts, self.categoryChecks) if cb.isChecked()],
+            "dimensions": [t for t, cb in zip(self._dimension_texts, self.dimensionChecks) if cb.isChecked()],
+        }
+        self._savedState = state
+        path = self._state_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.debug(f"Could not save GUI state: {e}")
+
+    def _load_state(self):
+        try:
+            with open(self._state_path(), "r", encoding="utf-8") as f:
+                state = json.load(f) or {}
+        except Exception:
+            return
+        if not isinstance(state, dict):
+            return
+        self._savedState = state
+
+        params = state.get("params") or {}
+        for key, w in self.param_widgets.items():
+            if key in params:
+                self._apply_value_to_widget(w, params[key])
+
+        self._ignoreDimSync = True
+        try:
+            cats = state.get("categories")
+            if isinstance(cats, list):
+                cat_set = {str(c).lower() for c in cats}
+                for name, cb in self._categoryByName.items():
+                    cb.setChecked(name in cat_set)
+            dims = state.get("dimensions")
+            if isinstance(dims, list):
+                dim_set = {str(d).lower() for d in dims}
+                for name, cb in self._dimensionByName.items():
+                    cb.setChecked(name in dim_set)
+            if isinstance(cats, list) or isinstance(dims, list):
+                self._skipNextDimSync = True
+        finally:
+            self._ignoreDimSync = False
+
+    def _on_handcrafted_toggled(self, expanded=True):
+        if expanded:
+            self._ensure_handcrafted_built()
+
+    def _ensure_handcrafted_built(self):
+        """Build the Handcrafted Settings contents on first expansion."""
+        if self._hcBuilt:
+            return
+        self._hcBuilt = True
+        handLay = self._hcLayout
+        rdef = _rdef()
+
+        # (A) Flags (compact grid)
+        flagsBox = qt.QGroupBox("Flags")
+        flagsGrid = qt.QGridLayout(flagsBox)
+        flagsGrid.setHorizontalSpacing(14)
+        flagsGrid.setVerticalSpacing(6)
+        flagsGrid.setContentsMargins(8, 8, 8, 8)
+
+        new_widgets = {}
+
+        for i, (label_text, key, default_val, tip) in enumerate(_IBSI_FLAGS):
+            cb = qt.QCheckBox(label_text)
+            cb.setChecked(bool(rdef.get(key, default_val)))
+            cb.setToolTip(tip)
+            new_widgets["radiomics_" + key] = cb
+            flagsGrid.addWidget(cb, i // 3, i % 3)
+        for c in range(3):
+            flagsGrid.setColumnStretch(c, 1)
+
+        handLay.addWidget(flagsBox)
+
+        # (B) Main parameters in a neat form-like grid
+        paramsBox = qt.QGroupBox("Parameters")
+        gridHC = qt.QGridLayout(paramsBox)
+        gridHC.setContentsMargins(8, 8, 8, 8)
+        gridHC.setHorizontalSpacing(12)
+        gridHC.setVerticalSpacing(8)
+
+        INTERP_OPTIONS = ["Nearest", "linear", "bilinear", "trilinear", "tricubic-spline", "cubic", "bspline", "None"]
+
+        binSizeSpin = qt.QSpinBox()
+        binSizeSpin.setRange(1, 10 ** 9)
+        binSizeSpin.setValue(int(rdef.get("BinSize", 25)))
+        self._shrink_editor(binSizeSpin, 160)
+
+        fvm = self._tune_combo(qt.QComboBox())
+        fvm.addItems(["REAL_VALUE", "APPROXIMATE_VALUE"])
+        self._set_combo_safe(fvm, rdef.get("feature_value_mode", "REAL_VALUE"))
+        self._shrink_editor(fvm, 160)
+
+        dtype = self._tune_combo(qt.QComboBox())
+        dtype.addItems(["CT", "MR", "PET", "OTHER"])
+        self._set_combo_safe(dtype, rdef.get("DataType", "OTHER"))
+        self._shrink_editor(dtype, 160)
+
+        discType = self._tune_combo(qt.QComboBox())
+        discType.addItems(["FBS", "FBN"])
+        self._set_combo_safe(discType, rdef.get("DiscType", "FBS"))
+        self._shrink_editor(discType, 160)
+
+        voxI = self._tune_combo(qt.QComboBox())
+        voxI.addItems(INTERP_OPTIONS)
+        self._set_combo_safe(voxI, rdef.get("VoxInterp", "Nearest"))
+        self._shrink_editor(voxI, 160)
+
+        roiI = self._tune_combo(qt.QComboBox())
+        roiI.addItems(INTERP_OPTIONS)
+        self._set_combo_safe(roiI, rdef.get("ROIInterp", "Nearest"))
+        self._shrink_editor(roiI, 160)
+
+        iso3D = qt.QDoubleSpinBox()
+        iso3D.setRange(0.0, 1e12)
+        iso3D.setSingleStep(0.1)
+        iso3D.setValue(float(rdef.get("isotVoxSize", 2)))
+        self._shrink_editor(iso3D, 160)
+
+        iso2D = qt.QDoubleSpinBox()
+        iso2D.setRange(0.0, 1e12)
+        iso2D.setSingleStep(0.1)
+        iso2D.setValue(float(rdef.get("isotVoxSize2D", 2)))
+        self._shrink_editor(iso2D, 160)
+
+        reSeg01Edit = qt.QLineEdit()
+        reSeg01Edit.setPlaceholderText("None or value")
+        reSeg01Edit.setText(str(rdef.get("ReSegIntrvl01", -1000)))
+        self._shrink_editor(reSeg01Edit, 160)
+
+        reSeg02Edit = qt.QLineEdit()
+        reSeg02Edit.setPlaceholderText("None or value")
+        reSeg02Edit.setText(str(rdef.get("ReSegIntrvl02", 400)))
+        self._shrink_editor(reSeg02Edit, 160)
+
+        roiPvSpin = qt.QDoubleSpinBox()
+        roiPvSpin.setRange(0.0, 1.0)
+        roiPvSpin.setSingleStep(0.05)
+        roiPvSpin.setValue(float(rdef.get("ROI_PV", 0.5)))
+        self._shrink_editor(roiPvSpin, 160)
+
+        qntzCombo = self._tune_combo(qt.QComboBox())
+        qntzCombo.addItems(["Uniform", "Lloyd-Max"])
+        self._set_combo_safe(qntzCombo, rdef.get("qntz", "Uniform"))
+        self._shrink_editor(qntzCombo, 160)
+
+        ivhType = qt.QSpinBox()
+        ivhType.setRange(0, 10 ** 9)
+        ivhType.setValue(int(rdef.get("IVH_Type", 3)))
+        self._shrink_editor(ivhType, 160)
+
+        ivhDisc = qt.QSpinBox()
+        ivhDisc.setRange(0, 10 ** 9)
+        ivhDisc.setValue(int(rdef.get("IVH_DiscCont", 1)))
+        self._shrink_editor(ivhDisc, 160)
+
+        ivhBin = qt.QDoubleSpinBox()
+        ivhBin.setRange(0.0, 1e12)
+        ivhBin.setSingleStep(0.1)
+        ivhBin.setValue(float(rdef.get("IVH_binSize", 2.0)))
+        self._shrink_editor(ivhBin, 160)
+
+        # helper for aligned 2x2 rows
+        def add_row(row, l1, w1, l2, w2):
+            gridHC.addWidget(qt.QLabel(l1), row, 0)
+            gridHC.addWidget(w1, row, 1)
+            gridHC.addWidget(qt.QLabel(l2), row, 2)
+            gridHC.addWidget(w2, row, 3)
+
+        add_row(0, "Bin Size", binSizeSpin, "Feature Value Mode", fvm)
+        add_row(1, "Modality", dtype, "Discretization", discType)
+        add_row(2, "Voxel Interpolation", voxI, "ROI Interpolation", roiI)
+        add_row(3, "Isotropic Voxel Size (3D)", iso3D, "Isotropic Voxel Size (2D)", iso2D)
+        add_row(4, "Re-seg Low", reSeg01Edit, "Re-seg High", reSeg02Edit)
+        add_row(5, "Partial Volume (ROI)", roiPvSpin, "Quantization", qntzCombo)
+        add_row(6, "IVH Type", ivhType, "IVH Disc/Cont", ivhDisc)
+        add_row(7, "IVH Bin Size", ivhBin, "", qt.QLabel(""))
+
+        # make columns behave nicely
+        gridHC.setColumnStretch(0, 0)
+        gridHC.setColumnStretch(1, 1)
+        gridHC.setColumnStretch(2, 0)
+        gridHC.setColumnStretch(3, 1)
+
+        handLay.addWidget(paramsBox)
+
+        new_widgets.update({
+            "radiomics_BinSize": binSizeSpin,
+            "radiomics_feature_value_mode": fvm,
+            "radiomics_DataType": dtype,
+            "radiomics_DiscType": discType,
+            "radiomics_VoxInterp": voxI,
+            "radiomics_ROIInterp": roiI,
+            "radiomics_isotVoxSize": iso3D,
+            "radiomics_isotVoxSize2D": iso2D,
+            "radiomics_ReSegIntrvl01": reSeg01Edit,
+            "radiomics_ReSegIntrvl02": reSeg02Edit,
+            "radiomics_ROI_PV": roiPvSpin,
+            "radiomics_qntz": qntzCombo,
+            "radiomics_IVH_Type": ivhType,
+            "radiomics_IVH_DiscCont": ivhDisc,
+            "radiomics_IVH_binSize": ivhBin,
+        })
+
+        # register widgets and their value readers (setup() already built
+        # readers for the eagerly-created widgets)
+        self.param_widgets.update(new_widgets)
+        for key, w in new_widgets.items():
+            self._widget_readers[key] = self._reader_for(w)
+
+        # apply any persisted user values and keep persisting new edits
+        params = (self._savedState or {}).get("params") or {}
+        for key, w in new_widgets.items():
+            if key in params:
+                self._apply_value_to_widget(w, params[key])
+        self._connect_state_autosave(new_widgets.values())
+
+    def setup(self):
+        super().setup()
+        root = self.layout
+        root.setSpacing(10)
+        rdef = _rdef()
+
+        pending_widgets = []
+
+        tabs = qt.QTabWidget()
+        tabs.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Expanding)
+        tabs.setStyleSheet(self._panel_stylesheet())
+        root.addWidget(tabs, 1)
 
         ioTab = self._make_scroll_tab(UI_TEXT["tab_io"], tabs)
         deepTab = self._make_scroll_tab(UI_TEXT["tab_mode"], tabs)
@@ -841,7 +1796,7 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         # Input/Output
         # -----------------------------
         ioGroup = qt.QGroupBox(UI_TEXT["grp_inputs_outputs"])
-        ioGroup.setStyleSheet("QGroupBox { font-weight: bold; font-size: 14px; }")
+        ioGroup.setProperty("pyseraBoldGroup", True)
         ioGroup.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Maximum)
         ioForm = qt.QFormLayout(ioGroup)
 
@@ -885,7 +1840,7 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         self.tmpDirEdit = ctk.ctkPathLineEdit()
         self.tmpDirEdit.filters = ctk.ctkPathLineEdit.Dirs
 
-        self.outputDirEdit.currentPath = RDEF.get("destination_folder", "./output_result")
+        self.outputDirEdit.currentPath = rdef.get("destination_folder", "./output_result")
 
         ioForm.addRow(UI_TEXT["lbl_output_folder"] + ":", self.outputDirEdit)
 
@@ -924,15 +1879,15 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
 
         # toggles row
         applyPreChk = qt.QCheckBox(UI_TEXT["chk_preprocess"])
-        applyPreChk.setChecked(bool(RDEF.get("apply_preprocessing", False)))
+        applyPreChk.setChecked(bool(rdef.get("apply_preprocessing", False)))
         applyPreChk.setToolTip("Apply IBSI-aligned preprocessing steps before feature extraction.")
 
         enParChk = qt.QCheckBox(UI_TEXT["chk_parallel"])
-        enParChk.setChecked(bool(RDEF.get("enable_parallelism", True)))
+        enParChk.setChecked(bool(rdef.get("enable_parallelism", True)))
         enParChk.setToolTip("Enable multiprocessing (if supported).")
 
         aggrChk = qt.QCheckBox(UI_TEXT["chk_aggregate"])
-        aggrChk.setChecked(bool(RDEF.get("aggregation_lesion", 0)))
+        aggrChk.setChecked(bool(rdef.get("aggregation_lesion", 0)))
         aggrChk.setToolTip("Aggregate features per ROI (multi-lesion support).")
 
         togRow = qt.QWidget()
@@ -948,26 +1903,26 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         # worker processes
         numWorkersEdit = qt.QLineEdit()
         numWorkersEdit.setPlaceholderText("auto or integer")
-        numWorkersEdit.setText(str(RDEF.get("num_workers", "auto")))
+        numWorkersEdit.setText(str(rdef.get("num_workers", "auto")))
         numWorkersEdit.setToolTip("Number of worker processes. Use 'auto' to let PySERA decide.")
 
         # min ROI
         minRoiSpin = qt.QDoubleSpinBox()
         minRoiSpin.setRange(0.0, 1e12)
         minRoiSpin.setDecimals(0)
-        minRoiSpin.setValue(float(RDEF.get("min_roi_volume", 10)))
+        minRoiSpin.setValue(float(rdef.get("min_roi_volume", 10)))
         minRoiSpin.setToolTip("Minimum ROI volume threshold (mm³).")
 
         # ROI mode
-        roiSel = qt.QComboBox()
+        roiSel = self._tune_combo(qt.QComboBox())
         roiSel.addItems(["per_Img", "per_region"])
-        self._set_combo_safe(roiSel, RDEF.get("roi_selection_mode", "per_Img"))
+        self._set_combo_safe(roiSel, rdef.get("roi_selection_mode", "per_Img"))
         roiSel.setToolTip("ROI grouping mode: per image or per region.")
 
         # log level
-        reportC = qt.QComboBox()
+        reportC = self._tune_combo(qt.QComboBox())
         reportC.addItems(["none", "error", "warning", "info", "all"])
-        self._set_combo_safe(reportC, RDEF.get("report", "all"))
+        self._set_combo_safe(reportC, rdef.get("report", "all"))
         reportC.setToolTip("Logging verbosity.")
 
         # small consistent editors
@@ -1001,16 +1956,17 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         row2Lay.addStretch(1)
         commonForm.addRow(row2)
 
-        # register widgets
-        self.param_widgets.update({
-            "radiomics_apply_preprocessing": applyPreChk,
-            "radiomics_enable_parallelism": enParChk,
-            "radiomics_aggregation_lesion": aggrChk,
-            "radiomics_num_workers": numWorkersEdit,
-            "radiomics_min_roi_volume": minRoiSpin,
-            "radiomics_roi_selection_mode": roiSel,
-            "radiomics_report": reportC,
-        })
+        # register widgets (bindings accumulate into one dict build at the
+        # end of setup instead of transient per-section update dicts)
+        pending_widgets.extend([
+            ("radiomics_apply_preprocessing", applyPreChk),
+            ("radiomics_enable_parallelism", enParChk),
+            ("radiomics_aggregation_lesion", aggrChk),
+            ("radiomics_num_workers", numWorkersEdit),
+            ("radiomics_min_roi_volume", minRoiSpin),
+            ("radiomics_roi_selection_mode", roiSel),
+            ("radiomics_report", reportC),
+        ])
 
         settingsRoot.addWidget(commonColl)
 
@@ -1023,168 +1979,11 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         handLay.setContentsMargins(8, 8, 8, 8)
         handLay.setSpacing(10)
 
-        # (A) Flags (compact grid)
-        flagsBox = qt.QGroupBox("Flags")
-        flagsGrid = qt.QGridLayout(flagsBox)
-        flagsGrid.setHorizontalSpacing(14)
-        flagsGrid.setVerticalSpacing(6)
-        flagsGrid.setContentsMargins(8, 8, 8, 8)
-
-        def mkchk(label_text: str, key: str, default_val: int = 0, tip: str = "") -> qt.QCheckBox:
-            cb = qt.QCheckBox(label_text)
-            cb.setChecked(bool(RDEF.get(key, default_val)))
-            if tip:
-                cb.setToolTip(tip)
-            self.param_widgets["radiomics_" + key] = cb
-            return cb
-
-        flags = [
-            mkchk("GL Round", "isGLround", 0, "Enable intensity rounding."),
-            mkchk("Scale", "isScale", 0, "Enable voxel scaling/resampling."),
-            mkchk("Re-segmentation Range", "isReSegRng", 0, "Enable re-segmentation by intensity range."),
-            mkchk("Outlier Removal", "isOutliers", 0, "Enable outlier handling."),
-            mkchk("Quantized Statistics", "isQuntzStat", 1, "Use quantized intensity statistics."),
-            mkchk("2D Isotropic", "isIsot2D", 0, "Use isotropic spacing for 2D mode."),
-        ]
-        for i, cb in enumerate(flags):
-            r = i // 3
-            c = i % 3
-            flagsGrid.addWidget(cb, r, c)
-        for c in range(3):
-            flagsGrid.setColumnStretch(c, 1)
-
-        handLay.addWidget(flagsBox)
-
-        # (B) Main parameters in a neat form-like grid
-        paramsBox = qt.QGroupBox("Parameters")
-        gridHC = qt.QGridLayout(paramsBox)
-        gridHC.setContentsMargins(8, 8, 8, 8)
-        gridHC.setHorizontalSpacing(12)
-        gridHC.setVerticalSpacing(8)
-
-        INTERP_OPTIONS = ["Nearest", "linear", "bilinear", "trilinear", "tricubic-spline", "cubic", "bspline", "None"]
-
-        binSizeSpin = qt.QSpinBox()
-        binSizeSpin.setRange(1, 10 ** 9)
-        binSizeSpin.setValue(int(RDEF.get("BinSize", 25)))
-        self._shrink_editor(binSizeSpin, 160)
-
-        fvm = qt.QComboBox()
-        fvm.addItems(["REAL_VALUE", "APPROXIMATE_VALUE"])
-        self._set_combo_safe(fvm, RDEF.get("feature_value_mode", "REAL_VALUE"))
-        self._shrink_editor(fvm, 160)
-
-        dtype = qt.QComboBox()
-        dtype.addItems(["CT", "MR", "PET", "OTHER"])
-        self._set_combo_safe(dtype, RDEF.get("DataType", "OTHER"))
-        self._shrink_editor(dtype, 160)
-
-        discType = qt.QComboBox()
-        discType.addItems(["FBS", "FBN"])
-        self._set_combo_safe(discType, RDEF.get("DiscType", "FBS"))
-        self._shrink_editor(discType, 160)
-
-        voxI = qt.QComboBox()
-        voxI.addItems(INTERP_OPTIONS)
-        self._set_combo_safe(voxI, RDEF.get("VoxInterp", "Nearest"))
-        self._shrink_editor(voxI, 160)
-
-        roiI = qt.QComboBox()
-        roiI.addItems(INTERP_OPTIONS)
-        self._set_combo_safe(roiI, RDEF.get("ROIInterp", "Nearest"))
-        self._shrink_editor(roiI, 160)
-
-        iso3D = qt.QDoubleSpinBox()
-        iso3D.setRange(0.0, 1e12)
-        iso3D.setSingleStep(0.1)
-        iso3D.setValue(float(RDEF.get("isotVoxSize", 2)))
-        self._shrink_editor(iso3D, 160)
-
-        iso2D = qt.QDoubleSpinBox()
-        iso2D.setRange(0.0, 1e12)
-        iso2D.setSingleStep(0.1)
-        iso2D.setValue(float(RDEF.get("isotVoxSize2D", 2)))
-        self._shrink_editor(iso2D, 160)
-
-        reSeg01Edit = qt.QLineEdit()
-        reSeg01Edit.setPlaceholderText("None or value")
-        reSeg01Edit.setText(str(RDEF.get("ReSegIntrvl01", -1000)))
-        self._shrink_editor(reSeg01Edit, 160)
-
-        reSeg02Edit = qt.QLineEdit()
-        reSeg02Edit.setPlaceholderText("None or value")
-        reSeg02Edit.setText(str(RDEF.get("ReSegIntrvl02", 400)))
-        self._shrink_editor(reSeg02Edit, 160)
-
-        roiPvSpin = qt.QDoubleSpinBox()
-        roiPvSpin.setRange(0.0, 1.0)
-        roiPvSpin.setSingleStep(0.05)
-        roiPvSpin.setValue(float(RDEF.get("ROI_PV", 0.5)))
-        self._shrink_editor(roiPvSpin, 160)
-
-        qntzCombo = qt.QComboBox()
-        qntzCombo.addItems(["Uniform", "Lloyd-Max"])
-        self._set_combo_safe(qntzCombo, RDEF.get("qntz", "Uniform"))
-        self._shrink_editor(qntzCombo, 160)
-
-        ivhType = qt.QSpinBox()
-        ivhType.setRange(0, 10 ** 9)
-        ivhType.setValue(int(RDEF.get("IVH_Type", 3)))
-        self._shrink_editor(ivhType, 160)
-
-        ivhDisc = qt.QSpinBox()
-        ivhDisc.setRange(0, 10 ** 9)
-        ivhDisc.setValue(int(RDEF.get("IVH_DiscCont", 1)))
-        self._shrink_editor(ivhDisc, 160)
-
-        ivhBin = qt.QDoubleSpinBox()
-        ivhBin.setRange(0.0, 1e12)
-        ivhBin.setSingleStep(0.1)
-        ivhBin.setValue(float(RDEF.get("IVH_binSize", 2.0)))
-        self._shrink_editor(ivhBin, 160)
-
-        # helper for aligned 2x2 rows
-        def add_row(row, l1, w1, l2, w2):
-            gridHC.addWidget(qt.QLabel(l1), row, 0)
-            gridHC.addWidget(w1, row, 1)
-            gridHC.addWidget(qt.QLabel(l2), row, 2)
-            gridHC.addWidget(w2, row, 3)
-
-        add_row(0, "Bin Size", binSizeSpin, "Feature Value Mode", fvm)
-        add_row(1, "Modality", dtype, "Discretization", discType)
-        add_row(2, "Voxel Interpolation", voxI, "ROI Interpolation", roiI)
-        add_row(3, "Isotropic Voxel Size (3D)", iso3D, "Isotropic Voxel Size (2D)", iso2D)
-        add_row(4, "Re-seg Low", reSeg01Edit, "Re-seg High", reSeg02Edit)
-        add_row(5, "Partial Volume (ROI)", roiPvSpin, "Quantization", qntzCombo)
-        add_row(6, "IVH Type", ivhType, "IVH Disc/Cont", ivhDisc)
-        add_row(7, "IVH Bin Size", ivhBin, "", qt.QLabel(""))
-
-        # make columns behave nicely
-        gridHC.setColumnStretch(0, 0)
-        gridHC.setColumnStretch(1, 1)
-        gridHC.setColumnStretch(2, 0)
-        gridHC.setColumnStretch(3, 1)
-
-        handLay.addWidget(paramsBox)
-
-        # register widgets
-        self.param_widgets.update({
-            "radiomics_BinSize": binSizeSpin,
-            "radiomics_feature_value_mode": fvm,
-            "radiomics_DataType": dtype,
-            "radiomics_DiscType": discType,
-            "radiomics_VoxInterp": voxI,
-            "radiomics_ROIInterp": roiI,
-            "radiomics_isotVoxSize": iso3D,
-            "radiomics_isotVoxSize2D": iso2D,
-            "radiomics_ReSegIntrvl01": reSeg01Edit,
-            "radiomics_ReSegIntrvl02": reSeg02Edit,
-            "radiomics_ROI_PV": roiPvSpin,
-            "radiomics_qntz": qntzCombo,
-            "radiomics_IVH_Type": ivhType,
-            "radiomics_IVH_DiscCont": ivhDisc,
-            "radiomics_IVH_binSize": ivhBin,
-        })
+        # Contents are built lazily on first expansion (the group starts
+        # collapsed and deep-feature users never open it). Until then the
+        # config defaults apply — the same values the widgets would show.
+        self._hcLayout = handLay
+        handColl.toggled.connect(self._on_handcrafted_toggled)
 
         settingsRoot.addWidget(handColl)
 
@@ -1207,7 +2006,7 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         }
 
         selGroup = qt.QGroupBox(UI_TEXT["grp_selection"])
-        selGroup.setStyleSheet("QGroupBox { font-weight: bold; font-size: 14px; }")
+        selGroup.setProperty("pyseraBoldGroup", True)
         selGroup.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Maximum)
 
         selLay = qt.QVBoxLayout(selGroup)
@@ -1216,11 +2015,13 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
 
         panelsRow = qt.QHBoxLayout()
 
-        cats_default = str(RDEF.get("categories", "all"))
-        catWidget, self.categoryChecks = self._build_check_grid_panel(UI_TEXT["panel_categories"], CAT_OPTIONS, cats_default)
+        cats_default = str(rdef.get("categories", "all"))
+        catWidget, catChecks = self._build_check_grid_panel(UI_TEXT["panel_categories"], CAT_OPTIONS, cats_default)
+        self.categoryChecks = tuple(catChecks)
 
-        dims_default = str(RDEF.get("dimensions"))
-        dimWidget, self.dimensionChecks = self._build_check_grid_panel(UI_TEXT["panel_dimensions"], DIM_OPTIONS, dims_default)
+        dims_default = str(rdef.get("dimensions"))
+        dimWidget, dimChecks = self._build_check_grid_panel(UI_TEXT["panel_dimensions"], DIM_OPTIONS, dims_default)
+        self.dimensionChecks = tuple(dimChecks)
 
         panelsRow.addWidget(catWidget, 3)
         panelsRow.addWidget(dimWidget, 2)
@@ -1236,9 +2037,11 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
             self._ignoreDimSync = True
             try:
                 for cb in self.dimensionChecks:
-                    cb.setChecked(True)
+                    if not cb.isChecked():
+                        cb.setChecked(True)
                 for cb in self.categoryChecks:
-                    cb.setChecked(True)
+                    if not cb.isChecked():
+                        cb.setChecked(True)
             finally:
                 self._ignoreDimSync = False
 
@@ -1246,9 +2049,11 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
             self._ignoreDimSync = True
             try:
                 for cb in self.categoryChecks:
-                    cb.setChecked(False)
+                    if cb.isChecked():
+                        cb.setChecked(False)
                 for cb in self.dimensionChecks:
-                    cb.setChecked(False)
+                    if cb.isChecked():
+                        cb.setChecked(False)
             finally:
                 self._ignoreDimSync = False
 
@@ -1261,33 +2066,45 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         selectTab.addWidget(selGroup)
 
         # Robust mapping (no cb.text() callable assumption)
-        self._categoryByName = {self._wtext(cb).strip().lower(): cb for cb in self.categoryChecks}
-        self._dimensionByName = {self._wtext(cb).strip().lower(): cb for cb in self.dimensionChecks}
+        # Names come straight from the option lists the checkboxes were
+        # built from — no Qt text() round-trip per checkbox.
+        self._categoryByName = {n.strip().lower(): cb for n, cb in zip(CAT_OPTIONS, self.categoryChecks)}
+        self._dimensionByName = {n.strip().lower(): cb for n, cb in zip(DIM_OPTIONS, self.dimensionChecks)}
+        self._dimLowerTexts = [n.strip().lower() for n in DIM_OPTIONS]
 
-        from functools import partial
+        self._DIM_TO_CATS = DIM_TO_CATS
         for cb in self.dimensionChecks:
-            cb.toggled.connect(partial(self._on_dimension_changed, DIM_TO_CATS))
-        qt.QTimer.singleShot(0, lambda: self._on_dimension_changed(DIM_TO_CATS))
+            cb.toggled.connect(self._schedule_dim_sync)
+        self._schedule_dim_sync()
 
         # -----------------------------
         # Extraction Mode
         # -----------------------------
         modeGroup = qt.QGroupBox(UI_TEXT["tab_mode"])
-        modeGroup.setStyleSheet("QGroupBox { font-weight: bold; font-size: 14px; }")
+        modeGroup.setProperty("pyseraBoldGroup", True)
         modeGroup.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Maximum)
         modeLay = qt.QVBoxLayout(modeGroup)
         modeLay.setSpacing(10)
 
-        extrMode = qt.QComboBox()
+        extrMode = self._tune_combo(qt.QComboBox())
         extrMode.addItems([UI_TEXT["mode_hand"], UI_TEXT["mode_deep"]])
 
-        default_mode_raw = str(RDEF.get("extraction_mode", "handcrafted_feature")).strip().lower()
+        default_mode_raw = str(rdef.get("extraction_mode", "handcrafted_feature")).strip().lower()
         pretty_default = UI_TEXT["mode_hand"] if "hand" in default_mode_raw else UI_TEXT["mode_deep"]
         self._set_combo_safe(extrMode, pretty_default)
 
-        deepModel = qt.QComboBox()
+        deepModel = self._tune_combo(qt.QComboBox())
         deepModel.addItems(["resnet50", "vgg16", "densenet121", "none"])
-        self._set_combo_safe(deepModel, RDEF.get("deep_learning_model", "none"))
+        self._set_combo_safe(deepModel, rdef.get("deep_learning_model", "none"))
+
+        # These two lists are expected to grow (more backbones/modes); a
+        # uniform-size batched QListView keeps popup layout O(viewport).
+        for cb in (extrMode, deepModel):
+            view = qt.QListView()
+            view.setUniformItemSizes(True)
+            view.setLayoutMode(qt.QListView.Batched)
+            view.setBatchSize(50)
+            cb.setView(view)
 
         row = qt.QWidget()
         rowLay = qt.QHBoxLayout(row)
@@ -1303,25 +2120,21 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
 
         deepTab.addWidget(modeGroup)
 
-        self.param_widgets.update({
-            "radiomics_extraction_mode": extrMode,
-            "radiomics_deep_learning_model": deepModel,
-        })
+        pending_widgets.extend([
+            ("radiomics_extraction_mode", extrMode),
+            ("radiomics_deep_learning_model", deepModel),
+        ])
 
-        def _toggle_for_mode():
-            pretty = self._combo_text_safe(extrMode).strip().lower()
-            is_hand = ("handcrafted" in pretty)
-            hcGroup.setEnabled(is_hand)
-            selGroup.setEnabled(is_hand)
-
-        _toggle_for_mode()
-        extrMode.currentIndexChanged.connect(lambda *_: _toggle_for_mode())
+        self._extrModeCombo = extrMode
+        self._hc_groups = (hcGroup, selGroup)
+        self._toggle_hc_mode()
+        extrMode.currentIndexChanged.connect(self._toggle_hc_mode)
 
         # -----------------------------
         # Run & Results
         # -----------------------------
         runGroup = qt.QGroupBox(UI_TEXT["grp_results"])
-        runGroup.setStyleSheet("QGroupBox { font-weight: bold; font-size: 14px; }")
+        runGroup.setProperty("pyseraBoldGroup", True)
         runGroup.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Expanding)
         runLay = qt.QVBoxLayout(runGroup)
         runLay.setSpacing(10)
@@ -1336,43 +2149,43 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
         self.computeButton.clicked.connect(self.onCompute)
 
         self.statusLabel = qt.QLabel("Ready.")
-        self.statusLabel.setStyleSheet("color: green; font-weight: bold; font-size: 12px;")
+        self._statusKind = "ready"
+        self.statusLabel.setProperty("pyseraStatus", "ready")
         self.statusLabel.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Maximum)
 
         topLay.addWidget(self.computeButton)
         topLay.addWidget(self.statusLabel, 1)
         runLay.addWidget(topRow)
 
-        # Summary table
-        runLay.addWidget(qt.QLabel(UI_TEXT["lbl_summary"] + ":"))
-        self.summaryTable = qt.QTableWidget()
-        self.summaryTable.setColumnCount(2)
-        self.summaryTable.setHorizontalHeaderLabels(["Parameter", "Value"])
-        self.summaryTable.verticalHeader().setVisible(False)
-        self.summaryTable.setEditTriggers(qt.QAbstractItemView.NoEditTriggers)
-        self.summaryTable.setSelectionBehavior(qt.QAbstractItemView.SelectRows)
-        self.summaryTable.setAlternatingRowColors(True)
-        self.summaryTable.setMaximumHeight(140)
-        runLay.addWidget(self.summaryTable)
-
-        # Extracted Features table
-        runLay.addWidget(qt.QLabel(UI_TEXT["lbl_extracted"] + ":"))
-        self.featureTable = qt.QTableWidget()
-        self.featureTable.setColumnCount(2)
-        self.featureTable.setHorizontalHeaderLabels(["Feature", "Value"])
-        self.featureTable.verticalHeader().setVisible(False)
-        self.featureTable.setEditTriggers(qt.QAbstractItemView.NoEditTriggers)
-        self.featureTable.setSelectionBehavior(qt.QAbstractItemView.SelectRows)
-        self.featureTable.setAlternatingRowColors(True)
-        self.featureTable.setMinimumHeight(220)
-        self.featureTable.setSizePolicy(qt.QSizePolicy.Expanding, qt.QSizePolicy.Expanding)
-        runLay.addWidget(self.featureTable, 1)
+        # Result tables are created on first visit to this tab (or first
+        # compute) — same lazy-build pattern as the Handcrafted panel.
+        self._runLay = runLay
 
         runTab.addWidget(runGroup)
 
-        # initial widths
-        self._apply_two_column_widths(self.summaryTable)
-        self._apply_two_column_widths(self.featureTable)
+        try:
+            run_tab_index = tabs.count - 1
+        except TypeError:
+            run_tab_index = tabs.count() - 1
+        tabs.currentChanged.connect(
+            lambda i: self._ensure_result_tables_built() if i == run_tab_index else None
+        )
+
+        self.param_widgets = dict(pending_widgets)
+
+        # One-time value-reader dispatch and checkbox label caches, so each
+        # run gathers the UI state with one bound call per widget.
+        self._widget_readers = {
+            key: self._reader_for(w) for key, w in self.param_widgets.items() if w is not None
+        }
+        self._category_texts = list(CAT_OPTIONS)
+        self._dimension_texts = list(DIM_OPTIONS)
+
+        # restore the last session's parameter state, then autosave edits
+        self._load_state()
+        self._connect_state_autosave(self.param_widgets.values())
+        self._connect_state_autosave(self.categoryChecks)
+        self._connect_state_autosave(self.dimensionChecks)
 
     def onCompute(self):
         is_single = self.singleModeRadio.isChecked()
@@ -1381,98 +2194,156 @@ class PySeraWidget(ScriptedLoadableModuleWidget):
             image_path = self.imagePathEdit.currentPath
             mask_path = self.maskPathEdit.currentPath
             if not image_path:
-                self.statusLabel.setText(f"Error: Select an {UI_TEXT['lbl_image'].lower()} file.")
-                self.statusLabel.setStyleSheet("color: red; font-weight: bold;")
+                self._set_status("error", f"Error: Select an {UI_TEXT['lbl_image'].lower()} file.")
                 logger.warning("No image file selected.")
                 return
             if not mask_path:
-                self.statusLabel.setText(f"Error: Select a {UI_TEXT['lbl_mask'].lower()} file.")
-                self.statusLabel.setStyleSheet("color: red; font-weight: bold;")
+                self._set_status("error", f"Error: Select a {UI_TEXT['lbl_mask'].lower()} file.")
                 logger.warning("No mask file selected.")
                 return
         else:
             image_path = self.imageFolderEdit.currentPath
             mask_path = self.maskFolderEdit.currentPath
-            if not image_path or not os.path.isdir(image_path):
-                self.statusLabel.setText(f"Error: Select an {UI_TEXT['lbl_image_folder'].lower()}.")
-                self.statusLabel.setStyleSheet("color: red; font-weight: bold;")
+            # One scandir pass per folder (cached by mtime) validates the
+            # inputs and fails fast before any worker is spawned.
+            image_names = self._list_dir_cached(image_path) if image_path else None
+            mask_names = self._list_dir_cached(mask_path) if mask_path else None
+            if image_names is None:
+                self._set_status("error", f"Error: Select an {UI_TEXT['lbl_image_folder'].lower()}.")
                 logger.warning("No image folder selected.")
                 return
-            if not mask_path or not os.path.isdir(mask_path):
-                self.statusLabel.setText(f"Error: Select a {UI_TEXT['lbl_mask_folder'].lower()}.")
-                self.statusLabel.setStyleSheet("color: red; font-weight: bold;")
+            if mask_names is None:
+                self._set_status("error", f"Error: Select a {UI_TEXT['lbl_mask_folder'].lower()}.")
                 logger.warning("No mask folder selected.")
                 return
+            if not image_names or not mask_names:
+                self._set_status("error", "Error: Image/mask folder is empty.")
+                logger.warning("Empty image or mask folder.")
+                return
 
         params = {}
-        params["radiomics_destination_folder"] = self.outputDirEdit.currentPath or RDEF.get("destination_folder", "./output_result")
+        params["radiomics_destination_folder"] = self.outputDirEdit.currentPath or _rdef().get("destination_folder", "./output_result")
+
+        # categories/dimensions selections (meaningful for handcrafted):
+        # one isChecked crossing per box, label join only for partial picks.
+        # In deep mode those panels are disabled, so skip the per-checkbox
+        # Qt crossings entirely and pass the backend default.
+        mode_pretty = self._combo_text_safe(self.param_widgets["radiomics_extraction_mode"]).strip().lower()
+        is_handcrafted = "handcrafted" in mode_pretty
+        if not is_handcrafted:
+            params["radiomics_categories"] = "all"
+            params["radiomics_dimensions"] = "all"
+        else:
+            checked = [cb.isChecked() for cb in self.categoryChecks]
+            if sum(checked) in (0, len(checked)):
+                params["radiomics_categories"] = "all"
+            else:
+                params["radiomics_categories"] = ",".join(t for t, c in zip(self._category_texts, checked) if c)
 
-        # categories/dimensions selections (meaningful for handcrafted)
-        total = len(getattr(self, "categoryChecks", []))
-        selected = [self._wtext(cb) for cb in getattr(self, "categoryChecks", []) if cb.isChecked()]
-        params["radiomics_categories"] = "all" if (not selected or (total and len(selected) == total)) else ",".join(selected)
+            dchecked = [cb.isChecked() for cb in self.dimensionChecks]
+            if sum(dchecked) in (0, len(dchecked)):
+                params["radiomics_dimensions"] = "all"
+            else:
+                params["radiomics_dimensions"] = ",".join(t for t, c in zip(self._dimension_texts, dchecked) if c)
 
-        dtotal = len(getattr(self, "dimensionChecks", []))
-        dselected = [self._wtext(cb) for cb in getattr(self, "dimensionChecks", []) if cb.isChecked()]
-        params["radiomics_dimensions"] = "all" if (not dselected or (dtotal and len(dselected) == dtotal)) else ",".join(dselected)
+        # Persisted values for widgets that don't exist yet (the Handcrafted
+        # panel builds lazily on first expansion) still apply to the run;
+        # live readers below override them for everything that is built.
+        for key, val in ((self._savedState or {}).get("params") or {}).items():
+            if key not in self._widget_readers:
+                params[key] = val
 
-        # gather all UI params
-        for key, widget in self.param_widgets.items():
-            if widget is None:
-                continue
-            params[key] = self._val_from_widget(widget)
+        # gather all UI params via the pre-bound readers
+        for key, reader in self._widget_readers.items():
+            params[key] = reader()
 
-        # map Extraction Mode UI text -> canonical value
-        pretty = str(params.get("radiomics_extraction_mode", UI_TEXT["mode_hand"])).strip().lower()
-        params["radiomics_extraction_mode"] = "handcrafted_feature" if "handcrafted" in pretty else "deep_feature"
+        # map Extraction Mode UI text -> canonical value (already read above)
+        params["radiomics_extraction_mode"] = "handcrafted_feature" if is_handcrafted else "deep_feature"
 
         mode_str = "Single Case" if is_single else "Batch (Folders)"
-        self.statusLabel.setText(f"Running ({mode_str})...")
-        self.statusLabel.setStyleSheet("color: blue; font-weight: bold;")
-        qt.QApplication.processEvents()
-
-        try:
+        self._set_status("running", f"Running ({mode_str})...")
+        self.computeButton.setEnabled(False)
+
+        # Run the extraction on a worker thread so the event loop keeps
+        # draining; a main-thread QTimer marshals completion back to the GUI.
+        # (PythonQt can't declare custom signals on Python QObject subclasses,
+        # so this is the Slicer-friendly stand-in for QRunnable+signals.)
+        def _job():
             t0 = time.time()
             if is_single:
                 output_csv, result = self.logic.run_single_case(image_path, mask_path, params)
             else:
                 output_csv, result = self.logic.run_batch_folders(image_path, mask_path, params)
-            dt = time.time() - t0
-
-            # Extracted Features from result (preferred)
+            # Format the preview rows here, off the GUI thread, so completion
+            # handling only has to populate the table models.
             rows = self.logic.feature_rows_from_result(result)
-            if rows:
-                self._fill_extracted_features_table(rows)
-                extracted_count = len(rows)
-            else:
-                self._fill_extracted_features_table([["Info", "Waiting for CSV to load..."]])
-                extracted_count = 0
+            return output_csv, result, rows, time.time() - t0
+
+        if self._runExecutor is None:
+            import concurrent.futures
+            self._runExecutor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="PySeraRun"
+            )
+        self._runFuture = self._runExecutor.submit(_job)
+        self._runModeStr = mode_str
+
+        # One persistent timer, started/stopped per run, instead of a fresh
+        # QTimer allocation per tick.
+        if self._runPollTimer is None:
+            timer = qt.QTimer()
+            timer.setInterval(100)
+            timer.timeout.connect(self._check_run_done)
+            self._runPollTimer = timer
+        self._runPollTimer.start()
+
+    def _check_run_done(self, *_):
+        fut = self._runFuture
+        if fut is None or not fut.done():
+            return
 
-            processed_files = "N/A"
-            if isinstance(result, dict) and "processed_files" in result:
-                processed_files = result.get("processed_files")
+        self._runFuture = None
+        mode_str = self._runModeStr
+        if self._runPollTimer is not None:
+            self._runPollTimer.stop()
+        self.computeButton.setEnabled(True)
 
-            self._fill_summary_table([
-                ("input_type", mode_str),
-                ("output_csv", output_csv),
-                ("processed_files", processed_files),
-                ("features_count", extracted_count),
-                ("runtime_seconds", round(dt, 3)),
-            ])
+        try:
+            output_csv, result, rows, dt = fut.result()
+        except Exception as e:
+            self._set_status("error", f"Error: {e}")
+            logger.error(f"Feature computation failed: {e}")
+            print(f"[PySera] ERROR: {e}")
+            return
 
-            self.statusLabel.setText(f"Done. {extracted_count} features. Output saved.")
-            self.statusLabel.setStyleSheet("color: green; font-weight: bold;")
+        self._on_compute_done(mode_str, output_csv, result, rows, dt)
 
-            logger.info(f"Done. InputType={mode_str}. Extracted={extracted_count}. Output={output_csv}")
+    def _on_compute_done(self, mode_str, output_csv, result, rows, dt):
+        # Extracted Features rows come preformatted from the worker thread.
+        if rows:
+            self._fill_extracted_features_table(rows)
+            extracted_count = len(rows)
+        else:
+            self._fill_extracted_features_table([["Info", "Waiting for CSV to load..."]])
+            extracted_count = 0
 
-            if not rows:
-                self._poll_csv_until_ready(output_csv)
+        processed_files = "N/A"
+        if isinstance(result, dict) and "processed_files" in result:
+            processed_files = result.get("processed_files")
 
-        except Exception as e:
-            self.statusLabel.setText(f"Error: {e}")
-            self.statusLabel.setStyleSheet("color: red; font-weight: bold;")
-            logger.error(f"Feature computation failed: {e}")
-            print(f"[PySera] ERROR: {e}")
+        self._fill_summary_table([
+            ("input_type", mode_str),
+            ("output_csv", output_csv),
+            ("processed_files", processed_files),
+            ("features_count", extracted_count),
+            ("runtime_seconds", round(dt, 3)),
+        ])
+
+        self._set_status("done", f"Done. {extracted_count} features. Output saved.")
+
+        logger.info(f"Done. InputType={mode_str}. Extracted={extracted_count}. Output={output_csv}")
+
+        if not rows:
+            self._poll_csv_until_ready(output_csv)
 
 
 # -------------------------------
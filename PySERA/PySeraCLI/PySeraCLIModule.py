@@ -1,36 +1,61 @@
 import os
 import sys
+import time
 import argparse
+import functools
 import importlib
+import importlib.util
 
+# Last event-pump time; verbose runs pump the Qt loop at most every 50 ms.
+_LAST_PUMP = [0.0]
 
-def _log(prefix: str, msg: str):
+
+def _log(prefix: str, msg: str, pump: bool = True):
     print(f"[{prefix}] {msg}")
-    try:
-        slicer = importlib.import_module("slicer")
-        slicer.app.processEvents()
-    except Exception:
-        pass
+    if not pump:
+        return
+    # In Slicer's embedded interpreter the slicer module is imported long
+    # before any CLI module runs, so a sys.modules read suffices — no import
+    # lock, no finder walk. Outside Slicer it is absent and we skip pumping.
+    slicer = sys.modules.get("slicer")
+    if slicer is None:
+        return
+    now = time.monotonic()
+    if now - _LAST_PUMP[0] > 0.05:
+        _LAST_PUMP[0] = now
+        try:
+            slicer.app.processEvents()
+        except Exception:
+            pass
 
 
 def log_info(msg): _log("INFO", msg)
-def log_debug(msg): _log("DEBUG", msg)
+def log_debug(msg): _log("DEBUG", msg, pump=False)
 def log_warning(msg): _log("WARNING", msg)
 def log_error(msg): _log("ERROR", msg)
 
 
-def _ensure_pysera_available():
+def _is_pysera_installed():
+    # find_spec consults the finder caches without executing the module, so
+    # the availability probe costs microseconds instead of a full import of
+    # pysera and its numpy/SimpleITK dependency tree.
     try:
-        importlib.import_module("pysera")
-        return
+        return importlib.util.find_spec("pysera") is not None
     except Exception:
-        pass
+        return False
+
+
+def _ensure_pysera_available():
+    if _is_pysera_installed():
+        return
 
     try:
         slicer = importlib.import_module("slicer")
         log_info("Installing 'pysera' via slicer.util.pip_install ...")
         slicer.util.pip_install("pysera")
-        importlib.import_module("pysera")
+        importlib.invalidate_caches()
+        if not _is_pysera_installed():
+            raise ImportError("'pysera' still not found after install.")
         log_info("'pysera' installed and importable.")
     except Exception as e:
         raise ImportError(
@@ -43,13 +68,57 @@ def _import_pysera():
     return importlib.import_module("pysera")
 
 
+def _read_json(path):
+    # orjson parses bytes in C and is several times faster than the stdlib
+    # scanner; fall back to json when it is not installed.
+    try:
+        import orjson
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except ImportError:
+        import json
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
 def _load_default_params():
+    """Load the spec defaults, memoized on the YAML's mtime+size so repeat
+    invocations in one Slicer session skip file IO and parsing entirely."""
     thisdir = os.path.dirname(__file__)
     libdir = os.path.join(thisdir, "pysera_cli_lib")
+    yaml_path = os.path.join(libdir, "parameters.yaml")
+    try:
+        st = os.stat(yaml_path)
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    return _load_default_params_cached(libdir, key)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_default_params_cached(libdir, _stat_key):
     yaml_path = os.path.join(libdir, "parameters.yaml")
     json_path = os.path.join(libdir, "parameters.json")
 
     if os.path.exists(yaml_path):
+        # Warm-run fast path: a JSON cache keyed by the YAML's mtime+size
+        # skips PyYAML import and parse entirely until the YAML changes.
+        cache_path = None
+        try:
+            st = os.stat(yaml_path)
+            cache_path = os.path.join(
+                libdir, f"parameters.cache.{st.st_mtime_ns:x}-{st.st_size:x}.json"
+            )
+        except OSError:
+            pass
+        if cache_path and os.path.exists(cache_path):
+            try:
+                data = _read_json(cache_path) or {}
+                log_debug(f"Loaded default parameters from cache {cache_path}")
+                return data
+            except Exception:
+                pass  # corrupt cache: fall through to the YAML parse
+
         try:
             yaml = importlib.import_module("yaml")
         except Exception as e:
@@ -58,15 +127,31 @@ def _load_default_params():
                 "Install it (pip install PyYAML) or provide parameters.json."
             ) from e
 
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        # libyaml-backed parser when available; pure-Python SafeLoader
+        # otherwise. Binary mode lets the loader do the UTF-8 decode itself
+        # (in C under libyaml) instead of going through TextIOWrapper.
+        loader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+        with open(yaml_path, "rb") as f:
+            data = yaml.load(f, Loader=loader) or {}
         log_debug(f"Loaded default parameters from {yaml_path}")
+
+        if cache_path:
+            import json
+            # Best effort: read-only installs simply keep re-parsing the YAML.
+            try:
+                for name in os.listdir(libdir):
+                    if name.startswith("parameters.cache.") and name.endswith(".json"):
+                        os.remove(os.path.join(libdir, name))
+                tmp_path = cache_path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass
         return data
 
     if os.path.exists(json_path):
-        import json
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f) or {}
+        data = _read_json(json_path) or {}
         log_debug(f"Loaded default parameters from {json_path}")
         return data
 
@@ -74,46 +159,96 @@ def _load_default_params():
     return {}
 
 
+_BOOL_TRUE = frozenset(("true", "1", "yes", "y", "on"))
+
+
+def _parse_bool(val):
+    return str(val).strip().lower() in _BOOL_TRUE
+
+
+def _parse_list(val):
+    tokens = [x.strip() for x in str(val).split(",")]
+    tokens = [x for x in tokens if x != ""]
+    # Bulk C conversion for long numeric lists; .tolist() keeps params
+    # pickle/JSON friendly. Unlike np.fromstring, np.array raises on bad
+    # tokens instead of silently truncating, so invalid overrides still
+    # fail the parse. Python loop when numpy is unavailable.
+    try:
+        import numpy as np
+    except ImportError:
+        return [float(x) for x in tokens]
+    return np.array(tokens, dtype=np.float64).tolist()
+
+
+_COERCERS = {
+    "bool": _parse_bool,
+    "boolean": _parse_bool,
+    "int": int,
+    "float": float,
+    "list": _parse_list,
+}
+
+
+def _coercer_for(typ: str):
+    return _COERCERS.get((typ or "").lower(), str)
+
+
 def _coerce_value(val: str, typ: str):
-    typ = (typ or "").lower()
-    if typ in {"bool", "boolean"}:
-        return str(val).strip().lower() in {"true", "1", "yes", "y", "on"}
-    if typ == "int":
-        return int(val)
-    if typ == "float":
-        return float(val)
-    if typ == "list":
-        return [float(x.strip()) for x in str(val).split(",") if x.strip() != ""]
-    return val
+    return _coercer_for(typ)(val)
+
+
+_CORE_FLAGS = {"--image", "--mask", "--out"}
 
 
 def main(argv=None):
     argv = argv or sys.argv[1:]
     default_specs = _load_default_params()
 
-    parser = argparse.ArgumentParser(description="Run pysera radiomics extraction")
-    parser.add_argument("--image", required=True, help="Input image file path")
-    parser.add_argument("--mask", required=False, help="Input mask file path")
-    parser.add_argument("--out", required=False, default="pysera_features.csv", help="Output CSV path")
-
-    for key, entry in (default_specs or {}).items():
-        default_val = entry.get("value", None) if isinstance(entry, dict) else None
-        parser.add_argument(f"--{key}", required=False, help=f"Override default ({default_val})")
-
-    args = parser.parse_args(argv)
-
-    params = {}
-    for key, entry in (default_specs or {}).items():
-        if not isinstance(entry, dict):
-            continue
-        raw_cli_val = getattr(args, key, None)
-        default_val = entry.get("value", None)
-        typ = entry.get("type", "")
-
-        if raw_cli_val is not None:
-            params[key] = _coerce_value(raw_cli_val, typ)
-        else:
-            params[key] = default_val
+    flags = argv[::2]
+    if argv and len(argv) % 2 == 0 and "--image" in flags and set(flags) <= _CORE_FLAGS:
+        # Hot path: only the core IO flags, every parameter at its YAML
+        # default — skip building the O(n-params) argparse parser entirely.
+        from types import SimpleNamespace
+        pairs = dict(zip(flags, argv[1::2]))
+        args = SimpleNamespace(
+            image=pairs["--image"],
+            mask=pairs.get("--mask"),
+            out=pairs.get("--out", "pysera_features.csv"),
+        )
+        params = {
+            key: entry.get("value", None)
+            for key, entry in (default_specs or {}).items()
+            if isinstance(entry, dict)
+        }
+    else:
+        parser = argparse.ArgumentParser(description="Run pysera radiomics extraction")
+        parser.add_argument("--image", required=True, help="Input image file path")
+        parser.add_argument("--mask", required=False, help="Input mask file path")
+        parser.add_argument("--out", required=False, default="pysera_features.csv", help="Output CSV path")
+
+        # Register overrides with a per-spec type= so argparse coerces values
+        # during the parse instead of a second Python loop afterwards.
+        for key, entry in (default_specs or {}).items():
+            if isinstance(entry, dict):
+                default_val = entry.get("value", None)
+                coerce = _coercer_for(entry.get("type", ""))
+            else:
+                default_val, coerce = None, str
+            parser.add_argument(
+                f"--{key}", required=False, type=coerce,
+                help=f"Override default ({default_val})",
+            )
+
+        args = parser.parse_args(argv)
+
+        # Merge CLI overrides over spec defaults in one pass via the namespace
+        # dict — no per-key getattr descriptor lookups.
+        argvals = vars(args)
+        params = {
+            key: (argvals[key] if argvals.get(key) is not None else entry.get("value", None))
+            for key, entry in (default_specs or {}).items()
+            if isinstance(entry, dict)
+        }
 
     out_dir = os.path.dirname(args.out) or "."
     os.makedirs(out_dir, exist_ok=True)
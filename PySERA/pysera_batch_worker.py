@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Process-pool entry point for sharded batch extraction.
+#
+# Kept free of qt/ctk/slicer imports so worker processes can import this
+# module without a GUI. See PySERALogic._run_process_batch_parallel.
+
+import importlib
+
+_PYSERA = None
+_CLI_KWARGS = {}
+
+
+def worker_init(cli_kwargs=None):
+    """Pool initializer: pay the heavy imports once per worker process
+    instead of once per shard (dominant cost under spawn on Windows), and
+    receive the run's CLI kwargs once instead of pickling them per task."""
+    global _PYSERA, _CLI_KWARGS
+    if cli_kwargs is not None:
+        _CLI_KWARGS = cli_kwargs
+    try:
+        _PYSERA = importlib.import_module("pysera")
+    except Exception:
+        _PYSERA = None
+    for name in ("numpy", "SimpleITK", "scipy.ndimage"):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+
+def run_shard(image_dir, mask_dir, output_csv, cli_kwargs=None):
+    """Run pysera.process_batch on one shard of the batch folders."""
+    pysera = _PYSERA if _PYSERA is not None else importlib.import_module("pysera")
+    if cli_kwargs is None:
+        cli_kwargs = _CLI_KWARGS
+    return pysera.process_batch(
+        image_input=image_dir,
+        mask_input=mask_dir,
+        output_path=output_csv,
+        **cli_kwargs,
+    )
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Build-time converter: parameters.yaml -> parameters.json.
+#
+# Run by the extension packager so shipped installs read JSON at startup
+# and never pay the PyYAML import/parse cost. YAML stays the source of
+# truth for developers; this just refreshes the JSON sidecar.
+#
+# Usage:
+#   python tools/yaml_to_json.py [parameters.yaml ...]
+#
+# With no arguments, converts every parameters.yaml in the repository.
+
+import json
+import os
+import sys
+
+try:
+    import yaml
+except ImportError:
+    sys.exit("PyYAML is required: pip install PyYAML")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_YAMLS = [
+    os.path.join(REPO_ROOT, "PySERA", "parameters.yaml"),
+    os.path.join(REPO_ROOT, "PySERA", "PySeraCLI", "pysera_cli_lib", "parameters.yaml"),
+]
+
+
+def convert(yaml_path: str) -> str:
+    loader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=loader) or {}
+
+    json_path = os.path.join(os.path.dirname(yaml_path), "parameters.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return json_path
+
+
+def main(argv=None):
+    paths = (argv or sys.argv[1:]) or DEFAULT_YAMLS
+    for yaml_path in paths:
+        if not os.path.exists(yaml_path):
+            print(f"skipped (missing): {yaml_path}")
+            continue
+        json_path = convert(yaml_path)
+        print(f"{yaml_path} -> {json_path}")
+
+
+if __name__ == "__main__":
+    main()